@@ -10,10 +10,9 @@ from typing import Final, List, Optional, Set
 import arcpy
 
 from ..models import Source
-from ..utils import paths, ensure_dirs
+from ..utils import derive_authority_from_path, ensure_dirs, paths
 from ..utils.naming import sanitize_for_filename
 from ..utils.gdb_utils import reset_gdb
-from ..utils.paths import derive_authority_from_path
 from ..utils.run_summary import Summary
 from .geojson_loader import process_geojson_file
 from .gpkg_loader import process_gpkg_contents
@@ -366,9 +365,10 @@ class ArcPyFileGDBLoader:
             log.info(
                 "🔍 Fallback: Found %d shapefile(s) to process.",
                 len(shp_files))
+            staging_parts = staging_root.parts
             for shp_file_path in shp_files:
                 derived_authority = derive_authority_from_path(
-                    shp_file_path, staging_root
+                    shp_file_path, staging_parts
                 )
                 # This also needs to be adapted.
                 # Fallback globbing is complex with the new model.
@@ -386,9 +386,10 @@ class ArcPyFileGDBLoader:
             log.info(
                 "🔍 Fallback: Found %d GeoPackage(s) to process.",
                 len(gpkg_files))
+            staging_parts = staging_root.parts
             for gpkg_file_path in gpkg_files:
                 derived_authority = derive_authority_from_path(
-                    gpkg_file_path, staging_root
+                    gpkg_file_path, staging_parts
                 )
                 process_gpkg_contents(
                     gpkg_file_path,
@@ -414,9 +415,10 @@ class ArcPyFileGDBLoader:
                 "🔍 Fallback: Found %d JSON/GeoJSON file(s) to process.",
                 len(all_json_files),
             )
+            staging_parts = staging_root.parts
             for json_file_path in all_json_files:
                 derived_authority = derive_authority_from_path(
-                    json_file_path, staging_root
+                    json_file_path, staging_parts
                 )
                 process_geojson_file(
                     json_file_path,
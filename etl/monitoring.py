@@ -17,6 +17,7 @@ from typing import Any, Dict, List, Optional, Union
 import threading
 
 from .exceptions import ETLError, format_error_context
+from .utils.paths import paths
 
 # Structured logging formatter
 
@@ -404,7 +405,7 @@ class HealthMonitor:
             import shutil
             import os
             total, used, free = shutil.disk_usage(
-                getattr(self, "ROOT_PATH", Path.cwd().anchor))
+                getattr(self, "ROOT_PATH", paths.ROOT.anchor))
             free_percent = (free / total) * 100
 
             status = "healthy"
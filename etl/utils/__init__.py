@@ -1,11 +1,12 @@
 """Public re‑exports so callers can simply ``from etl.utils import download``."""
 
 from .io import CHUNK, download, extract_zip  # noqa: F401
-from .paths import ensure_dirs, paths  # noqa: F401
+from .paths import derive_authority_from_path, ensure_dirs, paths  # noqa: F401
 
 __all__ = [
     "paths",
     "ensure_dirs",
+    "derive_authority_from_path",
     "CHUNK",
     "download",
     "extract_zip",
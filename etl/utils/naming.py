@@ -6,9 +6,19 @@ from __future__ import annotations
 import re
 from typing import Final
 
+try:  # optional linear-time DFA engine; same results for ASCII-only classes
+    import re2 as _re_ascii  # type: ignore
+except ImportError:
+    _re_ascii = re
+
 from .sanitize import slugify  # central helper keeps hyphens for readability
 
-_ILLEGAL_ARCGIS: Final = re.compile(r"[^A-Za-z0-9_]")   # stricter pattern
+# One class run covers illegal chars *and* underscores, so a single pass both
+# strips and collapses (``a-_@b`` → ``a_b``).
+_ILLEGAL_ARCGIS: Final = _re_ascii.compile(r"[^A-Za-z0-9]+")   # stricter pattern
+# Unicode-aware ``\W`` stays on stdlib ``re``: re2 treats ``\w`` as ASCII-only.
+_SDE_SEPARATORS: Final = re.compile(r"[\W_]+")
+_SDE_SWEDISH_MAP: Final = str.maketrans("åäö", "aao")
 # FGDB feature class limit
 _ARCGIS_MAX_LEN: Final = 128
 
@@ -24,9 +34,9 @@ def sanitize_for_filename(name: str) -> str:
 
 def sanitize_for_arcgis_name(name: str) -> str:
     """Return an FGDB-safe identifier (letters, digits, underscores, ≤31 chars)."""
-    txt = slugify(name).replace("-", "_")       # 1) drop hyphens
-    txt = _ILLEGAL_ARCGIS.sub("_", txt)         # 2) strip anything else
-    txt = re.sub(r"__+", "_", txt).strip("_")   # 3) collapse repeats
+    txt = slugify(name)                         # 1) normalise text
+    txt = _ILLEGAL_ARCGIS.sub("_", txt)         # 2) hyphens/illegal/repeats → _
+    txt = txt.strip("_")                        # 3) trim edges
     if txt and txt[0].isdigit():
         txt = f"_{txt}"                         # 4) SDE can’t start with digit
     return (txt or "unnamed")[:_ARCGIS_MAX_LEN]
@@ -68,21 +78,10 @@ def sanitize_sde_name(name: str) -> str:
     """
     original_name = name
 
-    # Replace problematic characters
-    # Convert common problematic chars to underscores
-    name = re.sub(r'[-\s\.]+', '_', name)  # hyphens, spaces, dots → underscore
-    name = re.sub(
-        r'[åäö]',
-        lambda m: {
-            'å': 'a',
-            'ä': 'a',
-            'ö': 'o'}[
-            m.group()],
-        name)  # Swedish chars
-    # Any remaining non-word chars → underscore
-    name = re.sub(r'[^\w]', '_', name)
-    # Multiple underscores → single underscore
-    name = re.sub(r'_{2,}', '_', name)
+    name = name.translate(_SDE_SWEDISH_MAP)  # Swedish chars
+    # Hyphens, spaces, dots, other non-word chars and repeated underscores
+    # all collapse to a single underscore in one pass
+    name = _SDE_SEPARATORS.sub('_', name)
     name = name.strip('_')  # Remove leading/trailing underscores
 
     # Ensure it starts with letter or underscore (not number)
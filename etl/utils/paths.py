@@ -13,16 +13,26 @@ class paths:  # pylint: disable=too-few-public-methods
     TEMP: Final[Path] = ROOT / "temp"
 
 
+_CORE_DIRS: Final[tuple[Path, ...]] = (paths.DOWNLOADS, paths.STAGING, paths.TEMP)
+
+
 def ensure_dirs() -> None:
     """Create all core directories if they don't exist."""
-    for d in (paths.DOWNLOADS, paths.STAGING, paths.TEMP):
+    for d in _CORE_DIRS:
         d.mkdir(parents=True, exist_ok=True)
 
 
-def derive_authority_from_path(file_path: Path, staging_root: Path) -> str:
-    """📂 Helper to derive authority from file path structure."""
-    try:
-        path_parts: tuple[str, ...] = file_path.relative_to(staging_root).parts
-        return path_parts[0] if len(path_parts) > 1 else "UNKNOWN_GLOB_AUTH"
-    except (IndexError, ValueError):
+def derive_authority_from_path(
+    file_path: Path, staging_root: Path | tuple[str, ...]
+) -> str:
+    """📂 Helper to derive authority from file path structure.
+
+    ``staging_root`` may also be passed as its pre-split ``parts`` tuple so
+    glob loops can hoist the split out of the per-file iteration.
+    """
+    root_parts = staging_root if isinstance(staging_root, tuple) else staging_root.parts
+    file_parts = file_path.parts
+    n_root = len(root_parts)
+    if file_parts[:n_root] != root_parts:
         return "UNKNOWN_GLOB_AUTH_EXC"
+    return file_parts[n_root] if len(file_parts) > n_root + 1 else "UNKNOWN_GLOB_AUTH"
@@ -7,15 +7,17 @@ from __future__ import annotations
 
 import functools
 import hashlib
-import json
 import logging
+import os
+import sys
 import threading
 import time
 import weakref
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Tuple, Union
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -24,24 +26,36 @@ from ..exceptions import ResourceError, NetworkError
 
 log = logging.getLogger(__name__)
 
+# Monotonic, integer-nanosecond clock; bound once to skip the attribute lookup
+_clock = time.perf_counter_ns
+
 
 @dataclass
 class PerformanceMetrics:
-    """Container for performance metrics."""
-    start_time: float
-    end_time: Optional[float] = None
+    """Container for performance metrics (timestamps from ``_clock``, in ns)."""
+    start_ns: int
+    end_ns: Optional[int] = None
     operation_count: int = 0
     bytes_processed: int = 0
     cache_hits: int = 0
     cache_misses: int = 0
     errors: int = 0
 
+    @property
+    def start_time(self) -> float:
+        """Start timestamp in seconds (``perf_counter`` clock, not wall time)."""
+        return self.start_ns / 1e9
+
+    @property
+    def end_time(self) -> Optional[float]:
+        """End timestamp in seconds, or None while the operation is running."""
+        return None if self.end_ns is None else self.end_ns / 1e9
+
     @property
     def duration(self) -> float:
         """Get operation duration in seconds."""
-        if self.end_time is None:
-            return time.time() - self.start_time
-        return self.end_time - self.start_time
+        end_ns = _clock() if self.end_ns is None else self.end_ns
+        return (end_ns - self.start_ns) / 1e9
 
     @property
     def throughput_ops_per_sec(self) -> float:
@@ -113,6 +127,11 @@ class ConnectionPool:
             session.mount("http://", adapter)
             session.mount("https://", adapter)
 
+            # Backstop for sessions dropped without close_all_sessions():
+            # release their pooled connections when the session is garbage
+            # collected. The callback must not reference the session itself.
+            weakref.finalize(session, adapter.close)
+
             # Set default headers
             session.headers.update({
                 'User-Agent': 'ETL-Pipeline/1.0 (Python requests)',
@@ -130,25 +149,66 @@ class ConnectionPool:
         return self._local.session
 
     def close_all_sessions(self):
-        """Close all active sessions and clean up connections."""
+        """Close all active sessions and clean up connections.
+
+        Every tracked session is closed explicitly, including ones still
+        referenced by other threads or callers; the per-session
+        ``weakref.finalize`` only backs this up for sessions never closed.
+        """
         closed_count = 0
-        for session in self._sessions:
+        for session in list(self._sessions):
             try:
                 session.close()
                 closed_count += 1
             except Exception as e:
                 log.warning("Error closing session: %s", e)
 
-        # Clear thread-local storage
-        if hasattr(self._local, 'session'):
-            delattr(self._local, 'session')
+        # Fresh thread-local so every thread builds a new session next time
+        self._local = threading.local()
+        self._sessions = weakref.WeakSet()
 
         log.info("🔒 Closed %d HTTP sessions", closed_count)
 
 
+def _estimate_size(data: Any, limit: int = sys.maxsize) -> int:
+    """Approximate byte size of a cache payload without stringifying it.
+
+    Text and bytes count their length and Response-like objects their raw
+    ``content``. Parsed JSON containers are walked and counted roughly as
+    they would serialize, so a large dict or list is not mistaken for a
+    small one. The walk stops once the total exceeds ``limit``.
+    """
+    size = 0
+    pending = [data]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, (str, bytes, bytearray)):
+            size += len(item)
+        elif isinstance(item, dict):
+            size += 2 + 2 * len(item)  # braces plus ':' and ',' per entry
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            size += 2 + len(item)  # brackets plus ',' per element
+            pending.extend(item)
+        elif item is None or isinstance(item, (bool, int, float)):
+            size += len(repr(item))
+        else:
+            content = getattr(item, 'content', None)
+            if isinstance(content, (bytes, bytearray)):
+                size += len(content)
+            else:
+                size += sys.getsizeof(item)
+        if size > limit:
+            break
+    return size
+
+
 class ResponseCache:
     """In-memory cache for HTTP responses with TTL and size limits."""
 
+    _MAX_SHARDS = 16
+
     def __init__(
         self,
         max_size: int = 1000,
@@ -159,9 +219,21 @@ class ResponseCache:
         self.default_ttl = default_ttl
         self.max_response_size = max_response_size
 
-        self._cache: Dict[str, Tuple[Any, float]] = {}
-        self._access_times: Dict[str, float] = {}
-        self._lock = threading.RLock()
+        # Split the cache into independently locked shards so worker threads
+        # hitting different keys don't serialise on one lock. The shard count
+        # is a power of two no larger than max_size so per-shard capacities
+        # never add up to more than max_size.
+        num_shards = 1
+        while num_shards < self._MAX_SHARDS and num_shards * 2 <= max_size:
+            num_shards *= 2
+        self._shard_mask = num_shards - 1
+        self._shard_max_size = max(1, max_size // num_shards)
+
+        # Within a shard, insertion order doubles as recency order: hits move
+        # to the end, eviction pops from the front.
+        self._shards: List[Tuple[OrderedDict[str, Tuple[Any, float, int]], threading.Lock]] = [
+            (OrderedDict(), threading.Lock()) for _ in range(num_shards)
+        ]
 
         log.info(
             "💾 Initialized response cache: max_size=%d, ttl=%ds",
@@ -173,14 +245,35 @@ class ResponseCache:
             url: str,
             params: Optional[Dict] = None,
             headers: Optional[Dict] = None) -> str:
-        """Generate cache key from request parameters."""
-        key_data = {
-            'url': url,
-            'params': sorted((params or {}).items()),
-            'headers': sorted((headers or {}).items()) if headers else None
-        }
-        key_string = json.dumps(key_data, sort_keys=True)
-        return hashlib.md5(key_string.encode()).hexdigest()
+        """Generate cache key from request parameters.
+
+        Feeds the raw URL and sorted params/headers straight into BLAKE2b;
+        the separator bytes keep distinct inputs from colliding.
+        """
+        # Common case: URL-only requests hash in a single call
+        if not params and not headers:
+            return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+        h = hashlib.blake2b(digest_size=16)
+        h.update(url.encode())
+        if params:
+            for k, v in sorted(params.items()):
+                h.update(b'\x1f')
+                h.update(str(k).encode())
+                h.update(b'=')
+                h.update(str(v).encode())
+        if headers:
+            h.update(b'\x1e')
+            for k, v in sorted(headers.items()):
+                h.update(str(k).encode())
+                h.update(b':')
+                h.update(str(v).encode())
+                h.update(b'\n')
+        return h.hexdigest()
+
+    def _shard(self, key: str) -> Tuple[OrderedDict, threading.Lock]:
+        """Return the (entries, lock) shard responsible for ``key``."""
+        return self._shards[hash(key) & self._shard_mask]
 
     def get(
             self,
@@ -189,21 +282,22 @@ class ResponseCache:
             headers: Optional[Dict] = None) -> Optional[Any]:
         """Get cached response if available and not expired."""
         key = self._generate_key(url, params, headers)
+        entries, lock = self._shard(key)
 
-        with self._lock:
-            if key not in self._cache:
+        with lock:
+            entry = entries.get(key)
+            if entry is None:
                 return None
 
-            data, expire_time = self._cache[key]
+            data, expire_time, _ = entry
 
             # Check if expired
             if time.time() > expire_time:
-                del self._cache[key]
-                self._access_times.pop(key, None)
+                del entries[key]
                 return None
 
-            # Update access time for LRU
-            self._access_times[key] = time.time()
+            # Mark as most recently used
+            entries.move_to_end(key)
 
             log.debug("Cache HIT for key: %s", key[:8])
             return data
@@ -218,57 +312,56 @@ class ResponseCache:
     ):
         """Cache response data with TTL."""
         # Check response size
-        try:
-            if hasattr(
-                    data, '__len__') and len(
-                    str(data)) > self.max_response_size:
-                log.debug(
-                    "Response too large to cache: %d bytes", len(
-                        str(data)))
-                return
-        except Exception:
-            pass  # If we can't determine size, proceed with caching
+        size = _estimate_size(data, self.max_response_size)
+        if size > self.max_response_size:
+            log.debug("Response too large to cache: %d bytes", size)
+            return
 
         key = self._generate_key(url, params, headers)
         expire_time = time.time() + (ttl or self.default_ttl)
+        entries, lock = self._shard(key)
 
-        with self._lock:
-            # Evict oldest items if cache is full
-            while len(self._cache) >= self.max_size:
-                self._evict_lru()
+        with lock:
+            entries[key] = (data, expire_time, size)
+            entries.move_to_end(key)
 
-            self._cache[key] = (data, expire_time)
-            self._access_times[key] = time.time()
+            # Evict oldest items if the shard is full
+            while len(entries) > self._shard_max_size:
+                self._evict_lru(entries)
 
             log.debug("Cache SET for key: %s", key[:8])
 
-    def _evict_lru(self):
-        """Evict least recently used item."""
-        if not self._access_times:
+    @staticmethod
+    def _evict_lru(entries: OrderedDict):
+        """Evict least recently used item from a shard (caller holds its lock)."""
+        if not entries:
             return
 
-        lru_key = min(self._access_times.items(), key=lambda x: x[1])[0]
-        self._cache.pop(lru_key, None)
-        self._access_times.pop(lru_key, None)
+        lru_key, _ = entries.popitem(last=False)
 
         log.debug("Evicted LRU cache entry: %s", lru_key[:8])
 
     def clear(self):
         """Clear all cached items."""
-        with self._lock:
-            self._cache.clear()
-            self._access_times.clear()
+        for entries, lock in self._shards:
+            with lock:
+                entries.clear()
         log.info("🗑️ Cleared response cache")
 
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        with self._lock:
-            return {
-                'size': len(self._cache),
-                'max_size': self.max_size,
-                'hit_rate': 0.0,  # Would need to track hits/misses for accurate rate
-                'memory_usage_estimate': len(str(self._cache))
-            }
+        size = 0
+        memory_usage = 0
+        for entries, lock in self._shards:
+            with lock:
+                size += len(entries)
+                memory_usage += sum(entry[2] for entry in entries.values())
+        return {
+            'size': size,
+            'max_size': self.max_size,
+            'hit_rate': 0.0,  # Would need to track hits/misses for accurate rate
+            'memory_usage_estimate': memory_usage
+        }
 
 
 class MemoryManager:
@@ -301,18 +394,26 @@ class MemoryManager:
 
         return optimal_size
 
-    def process_in_chunks(
+    def iter_process_in_chunks(
         self,
-        data: Union[List, str, bytes],
+        data: Union[List, str, bytes, bytearray],
         processor: Callable[[Any], Any],
-        chunk_size: Optional[int] = None
-    ) -> List[Any]:
-        """Process large data in memory-efficient chunks."""
+        chunk_size: Optional[int] = None,
+        zero_copy: bool = True
+    ) -> Iterator[Any]:
+        """Lazily process large data in memory-efficient chunks.
+
+        Yields one processor result per chunk so only a single chunk and its
+        result are alive at a time. With ``zero_copy`` (default), bytes-like
+        input is sliced through a ``memoryview`` and the processor receives
+        memoryview chunks rather than copies.
+        """
         if chunk_size is None:
             chunk_size = self.chunk_size
 
-        results = []
         total_size = len(data)
+        view = memoryview(data) if zero_copy and isinstance(
+            data, (bytes, bytearray)) else data
 
         log.debug(
             "Processing %d items in chunks of %d",
@@ -320,10 +421,9 @@ class MemoryManager:
             chunk_size)
 
         for i in range(0, total_size, chunk_size):
-            chunk = data[i:i + chunk_size]
+            chunk = view[i:i + chunk_size]
             try:
                 result = processor(chunk)
-                results.append(result)
             except Exception as e:
                 log.error(
                     "Error processing chunk %d-%d: %s",
@@ -333,40 +433,113 @@ class MemoryManager:
                 raise ResourceError(
                     f"Chunk processing failed: {e}",
                     resource_type="memory") from e
+            yield result
 
-        return results
+    def process_in_chunks(
+        self,
+        data: Union[List, str, bytes],
+        processor: Callable[[Any], Any],
+        chunk_size: Optional[int] = None
+    ) -> List[Any]:
+        """Process large data in chunks and collect all results.
+
+        Kept for backwards compatibility; prefer ``iter_process_in_chunks``
+        when results can be consumed one at a time.
+        """
+        return list(self.iter_process_in_chunks(
+            data, processor, chunk_size, zero_copy=False))
 
     def stream_file_chunks(
             self,
             file_path: Path,
-            chunk_size: Optional[int] = None):
-        """Generator to stream file contents in chunks."""
+            chunk_size: Optional[int] = None,
+            copy: bool = True):
+        """Generator to stream file contents in chunks.
+
+        By default each chunk is an independent ``bytes`` object. Pass
+        ``copy=False`` to read into a single reused buffer instead: chunks
+        are then ``memoryview`` slices of it, and each view is invalidated
+        (overwritten) on the next iteration, so callers must consume it
+        before asking for the next chunk and must not keep it.
+        """
         if chunk_size is None:
             chunk_size = self.chunk_size
 
         try:
             with file_path.open('rb') as f:
+                if copy:
+                    while True:
+                        chunk = f.read(chunk_size)
+                        if not chunk:
+                            break
+                        yield chunk
+                    return
+
+                buf = bytearray(chunk_size)
+                view = memoryview(buf)
                 while True:
-                    chunk = f.read(chunk_size)
-                    if not chunk:
+                    n = f.readinto(buf)
+                    if not n:
                         break
-                    yield chunk
+                    yield view[:n]
         except Exception as e:
             raise ResourceError(
                 f"File streaming failed: {e}",
                 resource_type="file_io") from e
 
 
+def _future_outcome(future: Future) -> Any:
+    """Return a finished future's result, or the exception it raised."""
+    exc = future.exception()
+    return exc if exc is not None else future.result()
+
+
+def _init_process_worker(log_level: int) -> None:
+    """Configure logging once per worker process (spawned children start bare)."""
+    logging.basicConfig(level=log_level)
+
+
 class ParallelProcessor:
-    """Parallel processing utilities for ETL operations."""
+    """Parallel processing utilities for ETL operations.
+
+    ``mode="thread"`` (default) suits I/O-bound processors. ``mode="process"``
+    runs them in a ``ProcessPoolExecutor`` for CPU-bound work; the processor
+    and every source must then be picklable (module-level functions, plain
+    data), and ``initializer``/``initargs`` run once per worker process.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        mode: Literal['thread', 'process'] = 'thread',
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Tuple[Any, ...] = ()
+    ):
+        if mode not in ('thread', 'process'):
+            raise ValueError(f"Unknown parallel mode: {mode!r}")
 
-    def __init__(self, max_workers: Optional[int] = None):
         self.max_workers = max_workers
-        self._metrics = PerformanceMetrics(start_time=time.time())
+        self.mode = mode
+        self._initializer = initializer
+        self._initargs = initargs
+        self._metrics = PerformanceMetrics(start_ns=_clock())
 
         log.info(
-            "⚡ Parallel processor initialized: max_workers=%s",
-            max_workers or "auto")
+            "⚡ Parallel processor initialized: max_workers=%s, mode=%s",
+            max_workers or "auto", mode)
+
+    def _create_executor(self, workers: Optional[int]) -> Executor:
+        """Build the executor for the configured mode."""
+        if self.mode == 'process':
+            initializer = self._initializer or _init_process_worker
+            initargs = self._initargs if self._initializer else (
+                log.getEffectiveLevel(),)
+            return ProcessPoolExecutor(
+                max_workers=workers, initializer=initializer, initargs=initargs)
+        return ThreadPoolExecutor(
+            max_workers=workers,
+            initializer=self._initializer,
+            initargs=self._initargs)
 
     def process_sources_parallel(
         self,
@@ -378,7 +551,8 @@ class ParallelProcessor:
         workers = max_workers or self.max_workers
         results = []
 
-        self._metrics.start_time = time.time()
+        self._metrics.start_ns = _clock()
+        self._metrics.end_ns = None
         self._metrics.operation_count = len(sources)
 
         log.info(
@@ -386,30 +560,35 @@ class ParallelProcessor:
             len(sources),
             workers)
 
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            # Submit all tasks
-            future_to_source = {
-                executor.submit(self._safe_processor, processor, source): source
-                for source in sources
-            }
-
-            # Collect results as they complete
-            for future in as_completed(future_to_source):
-                source = future_to_source[future]
-                try:
-                    result = future.result()
-                    results.append((source, result))
-                    log.debug(
-                        "✅ Completed processing source: %s", getattr(
-                            source, 'name', str(source)))
-                except Exception as e:
+        with self._create_executor(workers) as executor:
+            if self.mode == 'process':
+                # map() with a chunksize batches the IPC round-trips; the
+                # wrapper keeps one failure from aborting the whole map().
+                pool_size = workers or os.cpu_count() or 1
+                chunksize = max(1, len(sources) // (pool_size * 4))
+                outcomes = executor.map(
+                    functools.partial(self._safe_processor, processor),
+                    sources, chunksize=chunksize)
+            else:
+                # Threads ignore chunksize, so submit the processor directly
+                # and read each outcome back in source order.
+                outcomes = map(
+                    _future_outcome,
+                    [executor.submit(processor, source) for source in sources])
+
+            for source, result in zip(sources, outcomes):
+                results.append((source, result))
+                if isinstance(result, Exception):
                     self._metrics.errors += 1
-                    results.append((source, e))
                     log.error(
                         "❌ Failed processing source %s: %s", getattr(
-                            source, 'name', str(source)), e)
+                            source, 'name', str(source)), result)
+                else:
+                    log.debug(
+                        "✅ Completed processing source: %s", getattr(
+                            source, 'name', str(source)))
 
-        self._metrics.end_time = time.time()
+        self._metrics.end_ns = _clock()
 
         success_count = len(
             [r for r in results if not isinstance(r[1], Exception)])
@@ -418,28 +597,50 @@ class ParallelProcessor:
 
         return results
 
-    def _safe_processor(self, processor: Callable, source: Any) -> Any:
-        """Wrapper to safely execute processor with error handling."""
+    @staticmethod
+    def _safe_processor(processor: Callable, source: Any) -> Any:
+        """Run processor, returning any raised exception instead of propagating it.
+
+        Used in process mode only: ``executor.map`` re-raises the first failure
+        and abandons the rest, so failures are handed back as values and
+        logged by the caller.
+        """
         try:
             return processor(source)
         except Exception as e:
-            log.error("Processing failed for source %s: %s",
-                      getattr(source, 'name', str(source)), e)
-            raise
+            return e
 
     def get_metrics(self) -> PerformanceMetrics:
         """Get performance metrics for the last parallel operation."""
         return self._metrics
 
 
+_CACHEABLE_METHODS = frozenset({'GET', 'HEAD'})
+_UNCACHEABLE_METHODS = frozenset({'POST', 'PUT', 'PATCH', 'DELETE'})
+
+
 def cached_request(
     cache: ResponseCache,
     ttl: Optional[int] = None
 ) -> Callable:
-    """Decorator to cache HTTP requests."""
+    """Decorator to cache HTTP requests.
+
+    Only idempotent, non-streaming calls are cached; anything else goes
+    straight to the wrapped function without building a cache key.
+    """
     def decorator(func: Callable) -> Callable:
+        # Functions named after a mutating verb (e.g. ``post``) are never cached
+        if getattr(func, '__name__', '').upper() in _UNCACHEABLE_METHODS:
+            return func
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            # Uncacheable requests bypass key building entirely
+            method = kwargs.get('method')
+            if (method is not None and method.upper() not in _CACHEABLE_METHODS) \
+                    or kwargs.get('stream') is True:
+                return func(*args, **kwargs)
+
             # Extract URL and parameters for caching
             url = kwargs.get('url') or (args[0] if args else None)
             params = kwargs.get('params')
@@ -471,25 +672,22 @@ def monitor_performance(operation_name: str) -> Callable:
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_ns = _clock()
 
             try:
                 result = func(*args, **kwargs)
-                end_time = time.time()
-                duration = end_time - start_time
-
-                log.info("⏱️  %s completed in %.3fs", operation_name, duration)
-                return result
             except Exception as e:
-                end_time = time.time()
-                duration = end_time - start_time
                 log.error(
                     "⏱️  %s failed after %.3fs: %s",
                     operation_name,
-                    duration,
+                    (_clock() - start_ns) / 1e9,
                     e)
                 raise
 
+            log.info("⏱️  %s completed in %.3fs",
+                     operation_name, (_clock() - start_ns) / 1e9)
+            return result
+
         return wrapper
     return decorator
 
@@ -2,20 +2,60 @@
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import heapq
 import json
 import logging
+import math
+import operator
+import os
+import queue
+import random
 import statistics
 import threading
 import time
 from collections import defaultdict, deque
-from dataclasses import dataclass
+from itertools import islice
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
+import psutil  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+from .paths import paths
 from .performance_optimizer import PerformanceMetrics, SystemResources
 
 log = logging.getLogger(__name__)
 
+# Maximum number of queued metrics applied per drain batch
+_RECORD_BATCH = 64
+
+# Monitoring ticks between net_connections() polls, which walk every socket
+_NET_POLL_TICKS = 6
+
+# Reused handle for this process; psutil.Process() re-reads procfs on creation.
+# Keyed by pid so forked workers build their own instead of reading the parent.
+_PROC: Tuple[int, Optional[psutil.Process]] = (0, None)
+_BYTES_TO_MB = 9.5367431640625e-07  # 1 / (1024 * 1024)
+
+
+def _current_process() -> psutil.Process:
+    """Return the cached psutil handle, rebuilding it after a fork."""
+    global _PROC
+    pid = os.getpid()
+    cached_pid, proc = _PROC
+    if proc is None or cached_pid != pid:
+        proc = psutil.Process(pid)
+        _PROC = (pid, proc)
+    return proc
+
 
 # Global cache and tuner placeholders - these would normally be defined
 # elsewhere
@@ -43,6 +83,28 @@ def get_global_tuner() -> GlobalTuner:
     return GlobalTuner()
 
 
+# PerformanceMetrics attribute behind each alert metric name
+_PERFORMANCE_METRIC_ATTRS: Dict[str, str] = {
+    "duration": "duration",
+    "throughput": "throughput_items_per_sec",
+    "memory_usage": "memory_peak",
+    "memory_efficiency": "memory_efficiency",
+    "cpu_percent": "cpu_percent",
+    "worker_count": "worker_count",
+    "items_processed": "items_processed",
+}
+
+_CONDITIONS: Dict[str, Callable[[float, float], bool]] = {
+    "gt": operator.gt,
+    "lt": operator.lt,
+    "eq": lambda value, threshold: abs(value - threshold) < 0.01,
+}
+
+
+def _never(value: float, threshold: float) -> bool:
+    return False
+
+
 @dataclass
 class AlertRule:
     """Performance alert rule configuration."""
@@ -55,6 +117,19 @@ class AlertRule:
     severity: str = "warning"  # "info", "warning", "error", "critical"
     enabled: bool = True
 
+    # Compiled from metric/condition so checks skip the string dispatch
+    _getter: Optional[Callable[[PerformanceMetrics], float]] = field(
+        init=False, repr=False, compare=False
+    )
+    _cmp: Callable[[float, float], bool] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        attr = _PERFORMANCE_METRIC_ATTRS.get(self.metric)
+        self._getter = operator.attrgetter(attr) if attr else None
+        self._cmp = _CONDITIONS.get(self.condition, _never)
+
     def check(self, value: float, duration: float) -> bool:
         """Check if alert condition is met."""
         if not self.enabled:
@@ -63,14 +138,7 @@ class AlertRule:
         if duration < self.duration_seconds:
             return False
 
-        if self.condition == "gt":
-            return value > self.threshold
-        elif self.condition == "lt":
-            return value < self.threshold
-        elif self.condition == "eq":
-            return abs(value - self.threshold) < 0.01
-
-        return False
+        return self._cmp(value, self.threshold)
 
 
 @dataclass
@@ -98,6 +166,126 @@ class PerformanceAlert:
         log.info("Alert resolved: %s", self.rule_name)
 
 
+_sample_time = operator.itemgetter(0)
+
+# Samples retained per operation
+_HIST_MAXLEN = 1000
+
+# Operation slot in active_alerts keys for system-level alerts
+_SYSTEM_ALERT = "system"
+
+
+# Columnar layout for recorded metrics: one contiguous column per field
+_METRICS_DTYPE = np.dtype(
+    [
+        ("start_time", "f8"),
+        ("duration", "f8"),
+        ("throughput", "f8"),
+        ("memory_peak", "f8"),
+        ("memory_efficiency", "f8"),
+        ("cpu_percent", "f4"),
+        ("items_processed", "i8"),
+        ("bytes_processed", "i8"),
+    ]
+)
+
+# Float columns summarized together by _summarize_operation_metrics
+_SUMMARY_FIELDS = ("duration", "throughput", "memory_peak")
+
+
+class MetricsRing:
+    """Fixed-capacity ring buffer of an operation's metrics.
+
+    Samples live in one preallocated structured array, so recording never
+    allocates and summaries reduce whole columns in C instead of looping
+    over ``PerformanceMetrics`` objects. Once full, the oldest sample is
+    overwritten. Item, byte and efficiency totals are kept as running sums.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._data = np.empty(capacity, dtype=_METRICS_DTYPE)
+        self._head = 0  # slot of the oldest sample
+        self.count = 0
+        self.items_total = 0
+        self.bytes_total = 0
+        self.efficiency_total = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, metrics: PerformanceMetrics) -> None:
+        """Write a sample into the next slot, evicting the oldest if full."""
+        slot = (self._head + self.count) % self.capacity
+        if self.count == self.capacity:
+            self._forget(slot)
+
+        self.items_total += metrics.items_processed
+        self.bytes_total += metrics.bytes_processed
+        self.efficiency_total += metrics.memory_efficiency
+        self._data[slot] = (
+            metrics.start_time,
+            metrics.duration,
+            metrics.throughput_items_per_sec,
+            metrics.memory_peak,
+            metrics.memory_efficiency,
+            metrics.cpu_percent,
+            metrics.items_processed,
+            metrics.bytes_processed,
+        )
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self._head = (self._head + 1) % self.capacity
+
+    def oldest_start_time(self) -> float:
+        """Start time of the oldest retained sample."""
+        return float(self._data["start_time"][self._head])
+
+    def popleft(self) -> None:
+        """Drop the oldest sample."""
+        if self.count:
+            self._forget(self._head)
+            self._head = (self._head + 1) % self.capacity
+            self.count -= 1
+
+    def totals(self) -> Tuple[int, int, float]:
+        """Running (items, bytes, memory efficiency) sums over retained samples."""
+        return self.items_total, self.bytes_total, self.efficiency_total
+
+    def _forget(self, slot: int) -> None:
+        """Remove a slot's sample from the running totals."""
+        row = self._data[slot]
+        self.items_total -= int(row["items_processed"])
+        self.bytes_total -= int(row["bytes_processed"])
+        self.efficiency_total -= float(row["memory_efficiency"])
+
+    def snapshot(self) -> np.ndarray:
+        """Copy of the retained samples, oldest first."""
+        end = self._head + self.count
+        if end <= self.capacity:
+            return self._data[self._head:end].copy()
+        return np.concatenate(
+            (self._data[self._head:], self._data[: end - self.capacity])
+        )
+
+
+def _make_hist() -> MetricsRing:
+    return MetricsRing(_HIST_MAXLEN)
+
+
+# Stand-in snapshot for operations without a history
+_EMPTY_RECORDS = np.empty(0, dtype=_METRICS_DTYPE)
+
+
+def _copy_summary(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a memoized summary, including its nested stat dicts."""
+    return {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in summary.items()
+    }
+
+
 @dataclass
 class PerformanceReport:
     """Performance report data."""
@@ -111,26 +299,19 @@ class PerformanceReport:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert report to dictionary."""
+        report = self._shallow_dict()
+        report["alerts"] = [asdict(alert) for alert in self.alerts]
+        return report
+
+    def _shallow_dict(self) -> Dict[str, Any]:
+        """Top-level report fields, with alerts left as dataclasses."""
         return {
             "period_start": self.period_start,
             "period_end": self.period_end,
             "duration_hours": (self.period_end - self.period_start) / 3600,
             "operations": self.operations,
             "system_metrics": self.system_metrics,
-            "alerts": [
-                {
-                    "rule_name": alert.rule_name,
-                    "metric": alert.metric,
-                    "value": alert.value,
-                    "threshold": alert.threshold,
-                    "severity": alert.severity,
-                    "timestamp": alert.timestamp,
-                    "message": alert.message,
-                    "acknowledged": alert.acknowledged,
-                    "resolved": alert.resolved,
-                }
-                for alert in self.alerts
-            ],
+            "alerts": self.alerts,
             "recommendations": self.recommendations,
         }
 
@@ -151,17 +332,41 @@ class PerformanceMonitor:
         self.report_interval_minutes = report_interval_minutes
 
         # Data storage
-        self.performance_history: Dict[str, deque] = defaultdict(
-            lambda: deque(maxlen=1000)
-        )
+        self.performance_history: Dict[str, MetricsRing] = defaultdict(_make_hist)
+        # Min-heap of (oldest start_time, operation), one entry per non-empty
+        # history, so cleanup only visits operations with expired samples.
+        # Entries may be stale (too old) after ring overwrites; cleanup
+        # re-reads the ring and pushes the real oldest back.
+        self._retention_index: List[Tuple[float, str]] = []
+        # Bumped whenever an operation's history changes; summaries are
+        # memoized per operation as (version, first_start, last_start, summary)
+        self._op_version: Dict[str, int] = defaultdict(int)
+        self._summary_cache: Dict[str, tuple] = {}
+        # Producers only enqueue; history, alerts and tuning are applied in
+        # batches by whichever thread drains the queue
+        self._record_queue: queue.SimpleQueue = queue.SimpleQueue()
+        # operation -> [call count, total seconds] for calls too short to record
+        self._fast_calls: Dict[str, List[float]] = {}
+        # Tallies are read-modify-write and recorded from worker threads
+        self._fast_calls_lock = threading.Lock()
+        self._drain_lock = threading.Lock()
+        # Guards adding operations to performance_history; readers iterate a
+        # key snapshot taken under it. Ring contents are only written while
+        # holding _drain_lock.
+        self._struct_lock = threading.Lock()
+        # (monotonic time, SystemResources) in sample order
         self.system_history: deque = deque(maxlen=1000)
-        self.alerts: List[PerformanceAlert] = []
+        self.alerts: deque = deque()  # PerformanceAlert, in timestamp order
         self.alert_rules: List[AlertRule] = []
-        self.active_alerts: Dict[str, PerformanceAlert] = {}
+        self._rules_by_metric: Dict[str, List[AlertRule]] = {}
+        # Keyed by (rule name, operation name or _SYSTEM_ALERT)
+        self.active_alerts: Dict[tuple, PerformanceAlert] = {}
 
         # Monitoring state
         self.monitoring_active = False
         self.monitoring_thread: Optional[threading.Thread] = None
+        self._monitoring_task: Optional[asyncio.Task] = None
+        self._next_report_time = 0.0
         self.stop_event = threading.Event()
 
         # Statistics
@@ -171,6 +376,15 @@ class PerformanceMonitor:
             "monitoring_start_time": time.time(),
             "last_report_time": time.time(),
         }
+        # Interval arithmetic uses the monotonic clock; wall-clock times are
+        # kept only for timestamps stored on records, alerts and reports
+        self._started_monotonic = time.monotonic()
+
+        # System sampling state: prime cpu_percent so later non-blocking calls
+        # return the delta since the previous tick
+        psutil.cpu_percent(interval=None)
+        self._tick = 0
+        self._net_connections = 0
 
         # Setup default alert rules
         self._setup_default_alert_rules()
@@ -196,6 +410,26 @@ class PerformanceMonitor:
             self.monitoring_interval,
         )
 
+    async def astart_monitoring(self) -> None:
+        """Start continuous monitoring as a task on the running event loop.
+
+        System sampling runs in a worker thread so psutil calls never stall
+        the loop.
+        """
+        if self.monitoring_active:
+            log.warning("Performance monitoring already active")
+            return
+
+        self.monitoring_active = True
+        self.stop_event.clear()
+
+        self._monitoring_task = asyncio.create_task(self._monitoring_loop_async())
+
+        log.info(
+            "🔍 Started async performance monitoring (interval: %.1fs)",
+            self.monitoring_interval,
+        )
+
     def stop_monitoring(self) -> None:
         """Stop performance monitoring."""
         if not self.monitoring_active:
@@ -207,34 +441,109 @@ class PerformanceMonitor:
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=5.0)
 
+        if self._monitoring_task:
+            task, self._monitoring_task = self._monitoring_task, None
+            task.get_loop().call_soon_threadsafe(task.cancel)
+
+        self._drain_records()
+
         log.info("Stopped performance monitoring")
 
     def record_performance(self, metrics: PerformanceMetrics) -> None:
-        """Record performance metrics."""
-        operation = metrics.operation_name
+        """Record performance metrics.
+
+        The metrics are queued and applied by the monitoring loop. Without a
+        running loop, or once a full batch is waiting, the caller drains.
+        """
+        self._record_queue.put(metrics)
+
+        if (
+            not self.monitoring_active
+            or self._record_queue.qsize() >= _RECORD_BATCH
+        ):
+            self._drain_records(blocking=False)
+
+    def record_fast_call(self, operation: str, duration: float) -> None:
+        """Tally a call below the recording threshold without building metrics."""
+        with self._fast_calls_lock:
+            tally = self._fast_calls.get(operation)
+            if tally is None:
+                tally = self._fast_calls[operation] = [0, 0.0]
+            tally[0] += 1
+            tally[1] += duration
+
+    def get_fast_call_stats(self) -> Dict[str, Dict[str, float]]:
+        """Aggregate count and time of calls skipped by ``min_duration``."""
+        with self._fast_calls_lock:
+            return {
+                operation: {"count": count, "total_seconds": total}
+                for operation, (count, total) in self._fast_calls.items()
+            }
 
-        # Store in history
-        self.performance_history[operation].append(metrics)
-        self.stats["total_operations"] += 1
+    def _drain_records(self, blocking: bool = True) -> None:
+        """Apply queued metrics in batches of up to ``_RECORD_BATCH``."""
+        if not self._drain_lock.acquire(blocking):
+            return  # another thread is already draining
+
+        try:
+            record_queue = self._record_queue
+            while True:
+                batch = []
+                try:
+                    while len(batch) < _RECORD_BATCH:
+                        batch.append(record_queue.get_nowait())
+                except queue.Empty:
+                    pass
+
+                if batch:
+                    self._apply_records(batch)
+                if len(batch) < _RECORD_BATCH:
+                    break
+        finally:
+            self._drain_lock.release()
+
+    def _apply_records(self, batch: List[PerformanceMetrics]) -> None:
+        """Store a batch of metrics and run alert checks and tuning on it."""
+        history = self.performance_history
+        retention_index = self._retention_index
+        op_version = self._op_version
+
+        for metrics in batch:
+            operation = metrics.operation_name
+            ring = history.get(operation)
+            if ring is None:
+                with self._struct_lock:
+                    ring = history[operation]
+            if not ring:
+                heapq.heappush(retention_index, (metrics.start_time, operation))
+            ring.append(metrics)
+            op_version[operation] += 1
+
+        self.stats["total_operations"] += len(batch)
 
         # Check alerts
         if self.enable_alerts:
-            self._check_performance_alerts(metrics)
+            for metrics in batch:
+                self._check_performance_alerts(metrics)
 
         # Auto-tune if enabled
         tuner = get_global_tuner()
-        tuner.record_performance(metrics)
-
-        log.debug(
-            "Recorded performance: %s (%.2fs, %.2f items/s)",
-            operation,
-            metrics.duration,
-            metrics.throughput_items_per_sec,
-        )
+        for metrics in batch:
+            tuner.record_performance(metrics)
+
+        if log.isEnabledFor(logging.DEBUG):
+            for metrics in batch:
+                log.debug(
+                    "Recorded performance: %s (%.2fs, %.2f items/s)",
+                    metrics.operation_name,
+                    metrics.duration,
+                    metrics.throughput_items_per_sec,
+                )
 
     def add_alert_rule(self, rule: AlertRule) -> None:
         """Add performance alert rule."""
         self.alert_rules.append(rule)
+        self._rules_by_metric.setdefault(rule.metric, []).append(rule)
         log.info("Added alert rule: %s", rule.name)
 
     def remove_alert_rule(self, rule_name: str) -> bool:
@@ -244,27 +553,40 @@ class PerformanceMonitor:
             rule for rule in self.alert_rules if rule.name != rule_name]
 
         if len(self.alert_rules) < original_count:
+            self._rebuild_rule_index()
             log.info("Removed alert rule: %s", rule_name)
             return True
 
         return False
 
+    def _operation_names(self) -> tuple:
+        """Snapshot of recorded operation names, safe to iterate unlocked."""
+        with self._struct_lock:
+            return tuple(self.performance_history)
+
+    def _rebuild_rule_index(self) -> None:
+        """Regroup alert rules by the metric they watch."""
+        rules_by_metric: Dict[str, List[AlertRule]] = {}
+        for rule in self.alert_rules:
+            rules_by_metric.setdefault(rule.metric, []).append(rule)
+        self._rules_by_metric = rules_by_metric
+
     def get_performance_summary(
         self, operation: Optional[str] = None
     ) -> Dict[str, Any]:
         """Get performance summary for operation or all operations."""
+        self._drain_records()
+
         if operation:
             if operation not in self.performance_history:
                 return {"error": f"No data for operation: {operation}"}
 
-            history = list(self.performance_history[operation])
-            return self._summarize_operation_metrics(operation, history)
+            return self._operation_summary(operation)
 
         # Summary for all operations
         summary = {}
-        for op_name, history in self.performance_history.items():
-            summary[op_name] = self._summarize_operation_metrics(
-                op_name, list(history))
+        for op_name in self._operation_names():
+            summary[op_name] = self._operation_summary(op_name)
 
         return summary
 
@@ -273,7 +595,9 @@ class PerformanceMonitor:
         if not self.system_history:
             return {"status": "no_data"}
 
-        recent_metrics = list(self.system_history)[-10:]  # Last 10 samples
+        recent_metrics = [  # Last 10 samples
+            resources for _, resources in list(self.system_history)[-10:]
+        ]
 
         avg_cpu = statistics.mean(m.cpu_percent for m in recent_metrics)
         avg_memory = statistics.mean(m.memory_percent for m in recent_metrics)
@@ -296,37 +620,33 @@ class PerformanceMonitor:
             "disk_free_gb": min_disk_space,
             "active_alerts": len(self.active_alerts),
             "monitoring_uptime_hours": (
-                time.time() - self.stats["monitoring_start_time"]
+                time.monotonic() - self._started_monotonic
             )
             / 3600,
         }
 
     def generate_report(self, hours_back: int = 1) -> PerformanceReport:
         """Generate comprehensive performance report."""
+        self._drain_records()
+
         end_time = time.time()
         start_time = end_time - (hours_back * 3600)
 
         # Collect operation metrics
         operations = {}
-        for op_name, history_deque in self.performance_history.items():
-            # Convert deque to list explicitly
-            history_list = list(history_deque)
-            relevant_metrics = [
-                m for m in history if start_time <= m.start_time <= end_time
-            ]
-
-            if relevant_metrics:
-                operations[op_name] = self._summarize_operation_metrics(
-                    op_name, relevant_metrics
-                )
-
-        # Collect system metrics
-        relevant_system_metrics = [
-            m
-            for m in self.system_history
-            # Approximate, system metrics don't have timestamps
-            if start_time <= time.time() <= end_time
-        ]
+        for op_name in self._operation_names():
+            op_summary = self._operation_summary(op_name, start_time, end_time)
+            if "operation_count" in op_summary:
+                operations[op_name] = op_summary
+
+        # Collect system metrics: samples are monotonic-stamped, so the
+        # window is measured back from the monotonic "now"
+        window_end = time.monotonic()
+        samples = list(self.system_history)
+        first = bisect.bisect_left(
+            samples, window_end - (hours_back * 3600), key=_sample_time
+        )
+        relevant_system_metrics = [resources for _, resources in samples[first:]]
 
         system_metrics = {}
         if relevant_system_metrics:
@@ -346,8 +666,10 @@ class PerformanceMonitor:
             }
 
         # Collect alerts
-        relevant_alerts = [
-            alert for alert in self.alerts if start_time <= alert.timestamp <= end_time]
+        alert_time = operator.attrgetter("timestamp")
+        first = bisect.bisect_left(self.alerts, start_time, key=alert_time)
+        last = bisect.bisect_right(self.alerts, end_time, lo=first, key=alert_time)
+        relevant_alerts = list(islice(self.alerts, first, last))
 
         # Generate recommendations
         recommendations = self._generate_recommendations(
@@ -370,8 +692,16 @@ class PerformanceMonitor:
     def save_report(self, report: PerformanceReport, file_path: Path) -> None:
         """Save performance report to file."""
         try:
-            with file_path.open("w") as f:
-                json.dump(report.to_dict(), f, indent=2)
+            # Alerts serialize straight from the dataclasses: natively with
+            # orjson, through asdict with the stdlib fallback
+            payload = report._shallow_dict()
+            if orjson is not None:
+                file_path.write_bytes(
+                    orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+                )
+            else:
+                with file_path.open("w") as f:
+                    json.dump(payload, f, indent=2, default=asdict)
 
             log.info("Performance report saved to %s", file_path)
         except Exception as e:
@@ -379,29 +709,57 @@ class PerformanceMonitor:
 
     def _monitoring_loop(self) -> None:
         """Main monitoring loop."""
-        next_report_time = time.time() + (self.report_interval_minutes * 60)
+        self._next_report_time = self._jittered_report_deadline()
 
         while not self.stop_event.wait(self.monitoring_interval):
             try:
-                # Collect system metrics
-                system_resources = self._get_system_resources()
-                self.system_history.append(system_resources)
-
-                # Check system alerts
-                if self.enable_alerts:
-                    self._check_system_alerts(system_resources)
+                self._monitoring_tick(self._get_system_resources())
+            except Exception as e:
+                log.warning("Error in monitoring loop: %s", e)
 
-                # Generate periodic reports
-                if time.time() >= next_report_time:
-                    self._generate_periodic_report()
-                    next_report_time = time.time() + (self.report_interval_minutes * 60)
+    async def _monitoring_loop_async(self) -> None:
+        """Monitoring loop for asyncio pipelines."""
+        self._next_report_time = self._jittered_report_deadline()
 
-                # Cleanup old data
-                self._cleanup_old_data()
+        while not self.stop_event.is_set():
+            await asyncio.sleep(self.monitoring_interval)
+            if self.stop_event.is_set():
+                break
 
+            try:
+                system_resources = await asyncio.to_thread(self._get_system_resources)
+                self._monitoring_tick(system_resources)
             except Exception as e:
                 log.warning("Error in monitoring loop: %s", e)
 
+    def _jittered_report_deadline(self) -> float:
+        """Next report time, offset by up to ±10% of the interval.
+
+        The jitter keeps several monitors in one process from building their
+        reports on the same tick.
+        """
+        interval = self.report_interval_minutes * 60
+        return time.monotonic() + interval * (0.9 + 0.2 * random.random())
+
+    def _monitoring_tick(self, system_resources: SystemResources) -> None:
+        """Process one monitoring sample."""
+        # Apply metrics recorded since the last tick
+        self._drain_records()
+
+        self.system_history.append((time.monotonic(), system_resources))
+
+        # Check system alerts
+        if self.enable_alerts:
+            self._check_system_alerts(system_resources)
+
+        # Generate periodic reports
+        if time.monotonic() >= self._next_report_time:
+            self._generate_periodic_report()
+            self._next_report_time = self._jittered_report_deadline()
+
+        # Cleanup old data
+        self._cleanup_old_data()
+
     def _get_system_resources(self) -> SystemResources:
         """Get current system resources."""
         memory = psutil.virtual_memory()
@@ -409,28 +767,36 @@ class PerformanceMonitor:
             getattr(
                 self,
                 "_ROOT_PATH",
-                Path.cwd().anchor))
+                paths.ROOT.anchor))
+
+        if self._tick % _NET_POLL_TICKS == 0:
+            self._net_connections = len(psutil.net_connections())
+        self._tick += 1
 
         return SystemResources(
-            cpu_percent=psutil.cpu_percent(interval=0.1),
+            cpu_percent=psutil.cpu_percent(interval=None),
             memory_percent=memory.percent,
             memory_available_gb=memory.available / (1024**3),
             disk_free_gb=disk.free / (1024**3),
-            network_connections=len(psutil.net_connections()),
+            network_connections=self._net_connections,
         )
 
     def _check_performance_alerts(self, metrics: PerformanceMetrics) -> None:
         """Check performance metrics against alert rules."""
-        for rule in self.alert_rules:
-            if not rule.enabled:
-                continue
+        duration = metrics.duration
+        for metric, rules in self._rules_by_metric.items():
+            if metric not in _PERFORMANCE_METRIC_ATTRS:
+                continue  # system-only metric
+
+            for rule in rules:
+                if not rule.enabled or duration < rule.duration_seconds:
+                    continue
 
-            value = self._get_metric_value(metrics, rule.metric)
-            if value is None:
-                continue
+                value = rule._getter(metrics)
+                if not rule._cmp(value, rule.threshold):
+                    continue
 
-            if rule.check(value, metrics.duration):
-                alert_key = f"{rule.name}_{metrics.operation_name}"
+                alert_key = (rule.name, metrics.operation_name)
 
                 if alert_key not in self.active_alerts:
                     alert = PerformanceAlert(
@@ -459,10 +825,10 @@ class PerformanceMonitor:
         }
 
         for metric, value in system_metrics.items():
-            for rule in self.alert_rules:
-                if rule.metric == metric and rule.enabled:
+            for rule in self._rules_by_metric.get(metric, ()):
+                if rule.enabled:
                     if rule.check(value, self.monitoring_interval):
-                        alert_key = f"{rule.name}_system"
+                        alert_key = (rule.name, _SYSTEM_ALERT)
 
                         if alert_key not in self.active_alerts:
                             alert = PerformanceAlert(
@@ -485,57 +851,105 @@ class PerformanceMonitor:
         self, metrics: PerformanceMetrics, metric_name: str
     ) -> Optional[float]:
         """Extract metric value from performance metrics."""
-        metric_map = {
-            "duration": metrics.duration,
-            "throughput": metrics.throughput_items_per_sec,
-            "memory_usage": metrics.memory_peak,
-            "memory_efficiency": metrics.memory_efficiency,
-            "cpu_percent": metrics.cpu_percent,
-            "worker_count": metrics.worker_count,
-            "items_processed": metrics.items_processed,
-        }
+        attr = _PERFORMANCE_METRIC_ATTRS.get(metric_name)
+        return getattr(metrics, attr) if attr else None
 
-        return metric_map.get(metric_name)
+    def _operation_summary(
+        self,
+        operation: str,
+        start_time: float = -math.inf,
+        end_time: float = math.inf,
+    ) -> Dict[str, Any]:
+        """Summarize an operation's history within a start-time window.
+
+        The full-history summary is memoized per history version; a window
+        covering every retained sample reuses it instead of recomputing.
+        Callers always get their own copy of the summary.
+        """
+        # Version, totals and samples are read together so a concurrent
+        # drain cannot mix two states into one (cached) summary
+        with self._drain_lock:
+            version = self._op_version[operation]
+            cached = self._summary_cache.get(operation)
+            if cached is not None and cached[0] == version:
+                _, first, last, summary = cached
+                if start_time <= first and last <= end_time:
+                    return _copy_summary(summary)
+
+            history = self.performance_history.get(operation)
+            if history is None:
+                return self._summarize_operation_metrics(operation, _EMPTY_RECORDS)
+            totals = history.totals()
+            records = history.snapshot()
+
+        if not len(records):
+            return self._summarize_operation_metrics(operation, records)
+
+        started = records["start_time"]
+        first, last = float(started.min()), float(started.max())
+        if start_time <= first and last <= end_time:
+            summary = self._summarize_operation_metrics(operation, records, totals)
+            self._summary_cache[operation] = (version, first, last, summary)
+            return _copy_summary(summary)
+
+        return self._summarize_operation_metrics(
+            operation, records[(started >= start_time) & (started <= end_time)]
+        )
 
     def _summarize_operation_metrics(
-        self, operation: str, metrics: List[PerformanceMetrics]
+        self,
+        operation: str,
+        metrics: np.ndarray,
+        totals: Optional[Tuple[int, int, float]] = None,
     ) -> Dict[str, Any]:
-        """Summarize metrics for an operation."""
-        if not metrics:
+        """Summarize an operation's metric records (a ``MetricsRing`` snapshot).
+
+        ``totals`` are the ring's running (items, bytes, efficiency) sums, used
+        when ``metrics`` is the full history; windows are summed directly.
+        """
+        count = len(metrics)
+        if not count:
             return {"error": "No metrics available"}
 
-        durations = [m.duration for m in metrics]
-        throughputs = [m.throughput_items_per_sec for m in metrics]
-        memory_usage = [m.memory_peak for m in metrics]
+        if totals is None:
+            totals = (
+                int(metrics["items_processed"].sum()),
+                int(metrics["bytes_processed"].sum()),
+                float(metrics["memory_efficiency"].sum()),
+            )
+        items_total, bytes_total, efficiency_total = totals
+
+        # One (count, 3) block reduced along axis 0: a single C pass per statistic
+        block = np.column_stack([metrics[field] for field in _SUMMARY_FIELDS])
+        avg = block.mean(axis=0).tolist()
+        low = block.min(axis=0).tolist()
+        high = block.max(axis=0).tolist()
+        std = block.std(axis=0, ddof=1).tolist() if count > 1 else [0] * len(_SUMMARY_FIELDS)
 
         return {
-            "operation_count": len(metrics),
+            "operation_count": count,
             "duration": {
-                "avg": statistics.mean(durations),
-                "min": min(durations),
-                "max": max(durations),
-                "std": statistics.stdev(durations) if len(durations) > 1 else 0,
+                "avg": avg[0],
+                "min": low[0],
+                "max": high[0],
+                "std": std[0],
             },
             "throughput": {
-                "avg": statistics.mean(throughputs),
-                "min": min(throughputs),
-                "max": max(throughputs),
-                "std": statistics.stdev(throughputs) if len(throughputs) > 1 else 0,
+                "avg": avg[1],
+                "min": low[1],
+                "max": high[1],
+                "std": std[1],
             },
             "memory": {
-                "avg_mb": statistics.mean(memory_usage),
-                "min_mb": min(memory_usage),
-                "max_mb": max(memory_usage),
-                "std_mb": statistics.stdev(memory_usage)
-                if len(memory_usage) > 1
-                else 0,
+                "avg_mb": avg[2],
+                "min_mb": low[2],
+                "max_mb": high[2],
+                "std_mb": std[2],
             },
             "efficiency": {
-                "avg_items_per_mb": statistics.mean(
-                    m.memory_efficiency for m in metrics
-                ),
-                "total_items_processed": sum(m.items_processed for m in metrics),
-                "total_bytes_processed": sum(m.bytes_processed for m in metrics),
+                "avg_items_per_mb": efficiency_total / count,
+                "total_items_processed": items_total,
+                "total_bytes_processed": bytes_total,
             },
         }
 
@@ -546,30 +960,36 @@ class PerformanceMonitor:
         alerts: List[PerformanceAlert],
     ) -> List[str]:
         """Generate performance recommendations."""
-        recommendations = []
-
-        # Check for high-variance operations
+        # One pass over the operations; the three groups are concatenated so
+        # the output order matches the per-check ordering
+        high_variance: List[str] = []
+        low_throughput: List[str] = []
+        high_memory: List[str] = []
         for op_name, metrics in operations.items():
-            if ("duration" in metrics and metrics["duration"]
-                    ["std"] > metrics["duration"]["avg"] * 0.5):
-                recommendations.append(
+            duration = metrics.get("duration")
+            throughput = metrics.get("throughput")
+            memory = metrics.get("memory")
+
+            # Check for high-variance operations
+            if duration and duration["std"] > duration["avg"] * 0.5:
+                high_variance.append(
                     f"Operation '{op_name}' has high duration variance - consider investigating intermittent issues"
                 )
 
-        # Check for low throughput operations
-        for op_name, metrics in operations.items():
-            if "throughput" in metrics and metrics["throughput"]["avg"] < 0.5:
-                recommendations.append(
+            # Check for low throughput operations
+            if throughput and throughput["avg"] < 0.5:
+                low_throughput.append(
                     f"Operation '{op_name}' has low throughput - consider increasing concurrency or optimizing processing"
                 )
 
-        # Check for memory-intensive operations
-        for op_name, metrics in operations.items():
-            if "memory" in metrics and metrics["memory"]["avg_mb"] > 500:
-                recommendations.append(
+            # Check for memory-intensive operations
+            if memory and memory["avg_mb"] > 500:
+                high_memory.append(
                     f"Operation '{op_name}' uses high memory - consider batch processing or memory optimization"
                 )
 
+        recommendations = high_variance + low_throughput + high_memory
+
         # Check system-level issues
         if system_metrics and system_metrics.get("avg_cpu_percent", 0) > 80:
             recommendations.append(
@@ -592,27 +1012,33 @@ class PerformanceMonitor:
 
     def _generate_periodic_report(self) -> None:
         """Generate and log periodic performance report."""
+        if not log.isEnabledFor(logging.INFO):
+            return  # the report is only logged, skip building it
+
         try:
             report = self.generate_report(hours_back=1)
 
             log.info("📊 Performance Report (last hour):")
-            log.info(f"   Operations monitored: {len(report.operations)}")
+            log.info("   Operations monitored: %d", len(report.operations))
             log.info(
-                f"   Active alerts: {len([a for a in report.alerts if not a.resolved])}"
+                "   Active alerts: %d",
+                sum(1 for a in report.alerts if not a.resolved),
             )
-            log.info(f"   Recommendations: {len(report.recommendations)}")
+            log.info("   Recommendations: %d", len(report.recommendations))
 
             if report.system_metrics:
                 log.info(
-                    f"   Avg CPU: {report.system_metrics.get('avg_cpu_percent', 0):.1f}%"
+                    "   Avg CPU: %.1f%%",
+                    report.system_metrics.get("avg_cpu_percent", 0),
                 )
                 log.info(
-                    f"   Avg Memory: {report.system_metrics.get('avg_memory_percent', 0):.1f}%"
+                    "   Avg Memory: %.1f%%",
+                    report.system_metrics.get("avg_memory_percent", 0),
                 )
 
             # Show top 3 recommendations
             for rec in report.recommendations[:3]:
-                log.info(f"   💡 {rec}")
+                log.info("   💡 %s", rec)
 
         except Exception as e:
             log.error("Failed to generate periodic report: %s", e)
@@ -621,16 +1047,28 @@ class PerformanceMonitor:
         """Clean up old performance data."""
         cutoff_time = time.time() - (self.history_retention_hours * 3600)
 
-        # Clean up performance history
-        for operation in self.performance_history:
-            history = self.performance_history[operation]
-            # Keep only recent metrics
-            while history and history[0].start_time < cutoff_time:
-                history.popleft()
+        # Clean up performance history: visit only operations whose oldest
+        # sample may have expired, drop their expired heads and re-index them
+        index = self._retention_index
+        with self._drain_lock:  # rings are only mutated by the drain holder
+            while index and index[0][0] < cutoff_time:
+                _, operation = heapq.heappop(index)
+                history = self.performance_history.get(operation)
+                if not history:
+                    continue
+                expired = False
+                while history and history.oldest_start_time() < cutoff_time:
+                    history.popleft()
+                    expired = True
+                if expired:
+                    self._op_version[operation] += 1
+                if history:
+                    heapq.heappush(index, (history.oldest_start_time(), operation))
 
         # Clean up alerts
-        self.alerts = [
-            alert for alert in self.alerts if alert.timestamp > cutoff_time]
+        alerts = self.alerts
+        while alerts and alerts[0].timestamp <= cutoff_time:
+            alerts.popleft()
 
         # Clean up active alerts that are resolved
         resolved_alerts = [
@@ -690,6 +1128,7 @@ class PerformanceMonitor:
         ]
 
         self.alert_rules.extend(default_rules)
+        self._rebuild_rule_index()
         log.info("Setup %d default alert rules", len(default_rules))
 
 
@@ -735,61 +1174,60 @@ def stop_global_monitoring() -> None:
     _global_monitor.stop_monitoring()
 
 
-def performance_monitored(operation_name: str):
-    """Decorator to automatically monitor function performance."""
+def performance_monitored(
+    operation_name: str, min_duration: float = 0.001, sample_rate: float = 1.0
+):
+    """Decorator to automatically monitor function performance.
+
+    Successful calls shorter than ``min_duration`` seconds are only tallied
+    (see ``PerformanceMonitor.get_fast_call_stats``); longer ones are recorded
+    for a ``sample_rate`` fraction of calls. Failures are always recorded.
+    """
 
     def decorator(func: Callable) -> Callable:
-        def wrapper(*args, **kwargs):
-            monitor = get_global_monitor()
+        failed_name = f"{operation_name}_failed"
+
+        def record(
+            name: str, items: int, start_time: float, start: float, start_memory: float
+        ) -> None:
+            duration = time.perf_counter() - start
+            end_memory = _current_process().memory_info().rss * _BYTES_TO_MB
+
+            metrics = PerformanceMetrics(
+                operation_name=name,
+                start_time=start_time,
+                end_time=start_time + duration,
+                duration=duration,
+                memory_before=start_memory,
+                memory_after=end_memory,
+                memory_peak=max(start_memory, end_memory),
+                cpu_percent=50.0,  # Conservative estimate
+                worker_count=1,
+                items_processed=items,
+            )
 
-            # Record performance
+            get_global_monitor().record_performance(metrics)
+
+        def wrapper(*args, **kwargs):
+            # Wall clock for the record timestamp, perf_counter for duration
             start_time = time.time()
-            start_memory = psutil.Process().memory_info().rss / (1024 * 1024)
+            start = time.perf_counter()
+            start_memory = _current_process().memory_info().rss * _BYTES_TO_MB
 
             try:
                 result = func(*args, **kwargs)
-
-                # Create performance metrics
-                end_time = time.time()
-                end_memory = psutil.Process().memory_info().rss / (1024 * 1024)
-
-                metrics = PerformanceMetrics(
-                    operation_name=operation_name,
-                    start_time=start_time,
-                    end_time=end_time,
-                    duration=end_time - start_time,
-                    memory_before=start_memory,
-                    memory_after=end_memory,
-                    memory_peak=max(start_memory, end_memory),
-                    cpu_percent=50.0,  # Conservative estimate
-                    worker_count=1,
-                    items_processed=1,
-                )
-
-                monitor.record_performance(metrics)
-                return result
-
             except Exception:
                 # Still record performance for failed operations
-                end_time = time.time()
-                end_memory = psutil.Process().memory_info().rss / (1024 * 1024)
-
-                metrics = PerformanceMetrics(
-                    operation_name=f"{operation_name}_failed",
-                    start_time=start_time,
-                    end_time=end_time,
-                    duration=end_time - start_time,
-                    memory_before=start_memory,
-                    memory_after=end_memory,
-                    memory_peak=max(start_memory, end_memory),
-                    cpu_percent=50.0,  # Conservative estimate
-                    worker_count=1,
-                    items_processed=0,
-                )
-
-                monitor.record_performance(metrics)
+                record(failed_name, 0, start_time, start, start_memory)
                 raise
 
+            duration = time.perf_counter() - start
+            if duration < min_duration:
+                get_global_monitor().record_fast_call(operation_name, duration)
+            elif sample_rate >= 1.0 or random.random() < sample_rate:
+                record(operation_name, 1, start_time, start, start_memory)
+            return result
+
         return wrapper
 
     return decorator
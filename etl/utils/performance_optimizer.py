@@ -2,22 +2,92 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import ctypes
+import functools
 import gc
 import logging
+import math
 import os
+import pickle
+import queue
 import sys
 import threading
 import time
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import weakref
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from contextlib import contextmanager
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Callable, Collection, Deque, Dict, Iterator, List, Optional, Tuple, Union
 
 import psutil  # type: ignore
 
 log = logging.getLogger(__name__)
 
+# Seconds an RSS sample is reused by MemoryOptimizer.get_memory_usage_mb
+_RSS_TTL = 0.1
+
+# Seconds ConcurrencyOptimizer reuses a system sample / a disk free reading /
+# a system-wide TCP connection count (which walks every socket on the machine)
+_RESOURCES_TTL = 1.0
+_DISK_TTL = 30.0
+_NET_TTL = 30.0
+
+# Windows reports the process peak working set alongside RSS
+_HAS_PEAK_WSET = sys.platform == "win32"
+
+# Operation types allowed to run in worker processes; everything else uses threads
+_PROCESS_OPERATIONS = frozenset({"cpu_intensive"})
+
+# Operation type -> (max workers per CPU, scale on the ideal worker count)
+_OPERATION_PROFILES: Dict[str, Tuple[int, float]] = {
+    "network_io": (4, 2.0),
+    "cpu_intensive": (1, 1.0),
+    "mixed": (2, 1.4),
+}
+_DEFAULT_OPERATION_PROFILE = (1, 1.0)
+
+_COMPLEXITY_MULTIPLIERS: Dict[str, float] = {
+    "low": 1.5,
+    "medium": 1.0,
+    "high": 0.7,
+    "very_high": 0.5,
+}
+
+# Pressure score cutoffs for "critical", "high" and "moderate"; see
+# SystemResources.__post_init__
+_PRESSURE_CUTOFFS = ((0.95, "critical"), (0.80, "high"), (0.60, "moderate"))
+
+# Fraction of the 30% pressure dampening applied at each pressure level
+_PRESSURE_INDEX: Dict[str, float] = {
+    "low": 0.0,
+    "moderate": 0.3,
+    "high": 0.6,
+    "critical": 0.9,
+}
+
+# Generation-0 collections per second AdaptiveGCTuner steers towards, the
+# largest gen-0 threshold it will set, and CPython's default gen-0 threshold
+_GC_TARGET_RATE = 20.0
+_GC_MAX_THRESHOLD0 = 50_000
+_GC_DEFAULT_THRESHOLD0 = 700
+
+# Thread workers stop adding throughput around 64; processes are capped per CPU
+_MAX_WORKERS = 64
+
+# Memory reserved per worker process (~20MB baseline RSS plus headroom)
+_PROCESS_WORKER_HEADROOM = 50 * 1024 * 1024
+
 
 class WindowsResourceMonitor:
     """Windows-specific resource monitor."""
@@ -32,9 +102,12 @@ class WindowsResourceMonitor:
         return 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
-    """Performance metrics for operations."""
+    """Performance metrics for operations.
+
+    Throughput and memory efficiency are derived once at construction.
+    """
 
     operation_name: str
     start_time: float
@@ -48,27 +121,38 @@ class PerformanceMetrics:
     items_processed: int = 0
     bytes_processed: int = 0
 
-    @property
-    def throughput_items_per_sec(self) -> float:
-        """Calculate items processed per second."""
-        return self.items_processed / self.duration if self.duration > 0 else 0
-
-    @property
-    def throughput_mb_per_sec(self) -> float:
-        """Calculate MB processed per second."""
-        mb_processed = self.bytes_processed / (1024 * 1024)
-        return mb_processed / self.duration if self.duration > 0 else 0
+    # Items processed per second
+    throughput_items_per_sec: float = field(init=False, repr=False, compare=False)
+    # MB processed per second
+    throughput_mb_per_sec: float = field(init=False, repr=False, compare=False)
+    # Items processed per MB of memory used
+    memory_efficiency: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        duration = self.duration
+        if duration > 0:
+            self.throughput_items_per_sec = self.items_processed / duration
+            self.throughput_mb_per_sec = (
+                self.bytes_processed / (1024 * 1024) / duration
+            )
+        else:
+            self.throughput_items_per_sec = 0
+            self.throughput_mb_per_sec = 0
 
-    @property
-    def memory_efficiency(self) -> float:
-        """Calculate memory efficiency (items per MB of memory used)."""
         memory_used = self.memory_peak - self.memory_before
-        return self.items_processed / memory_used if memory_used > 0 else 0
+        self.memory_efficiency = (
+            self.items_processed / memory_used if memory_used > 0 else 0
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemResources:
-    """Current system resource usage."""
+    """Current system resource usage.
+
+    Pressure flags are derived once at construction from a score in which
+    memory weighs more than CPU: CPU load is elastic, while running out of
+    memory means swapping or an OOM kill.
+    """
 
     cpu_percent: float
     memory_percent: float
@@ -76,25 +160,66 @@ class SystemResources:
     disk_free_gb: float
     network_connections: int
 
-    @property
-    def is_under_pressure(self) -> bool:
-        """Check if system is under resource pressure."""
-        return (
-            self.cpu_percent > 80
-            or self.memory_percent > 85
-            or self.memory_available_gb < 0.5
-        )
+    # max(cpu, 1.5 * memory^2) as fractions, plus a penalty below 0.5 GB free
+    pressure_score: float = field(init=False, repr=False, compare=False)
+    # Whether the system is under resource pressure
+    is_under_pressure: bool = field(init=False, repr=False, compare=False)
+    # "low", "moderate", "high" or "critical"
+    pressure_level: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        memory = self.memory_percent / 100
+        score = max(self.cpu_percent / 100, memory * memory * 1.5)
+        score += max(0.0, 0.5 - self.memory_available_gb) * 2
+        self.pressure_score = score
+
+        self.pressure_level = "low"
+        for cutoff, level in _PRESSURE_CUTOFFS:
+            if score > cutoff:
+                self.pressure_level = level
+                break
+
+        self.is_under_pressure = score > 0.80 or self.memory_available_gb < 0.5
+
+
+class _PeakMemory:
+    """Peak RSS seen by ``MemoryOptimizer.memory_monitoring``.
+
+    Calling the tracker returns the peak so far; the monitored code calls
+    ``update_peak()`` at its own checkpoints instead of a sampler thread.
+    """
+
+    __slots__ = ("_sample", "peak")
+
+    def __init__(self, sample: Callable[[], float], initial: float):
+        self._sample = sample
+        self.peak = initial
+
+    def update_peak(self) -> float:
+        """Sample current memory and return the updated peak."""
+        current = self._sample()
+        if current > self.peak:
+            self.peak = current
+        return self.peak
+
+    def __call__(self) -> float:
+        return self.peak
 
-    @property
-    def pressure_level(self) -> str:
-        """Get system pressure level."""
-        if self.cpu_percent > 90 or self.memory_percent > 95:
-            return "critical"
-        elif self.cpu_percent > 80 or self.memory_percent > 85:
-            return "high"
-        elif self.cpu_percent > 60 or self.memory_percent > 70:
-            return "moderate"
-        return "low"
+
+@functools.lru_cache(maxsize=None)
+def _malloc_trim() -> Optional[Callable[[int], int]]:
+    """glibc's ``malloc_trim``, or None where the C library lacks it.
+
+    Swapping the allocator itself (jemalloc, mimalloc) only works when it is
+    preloaded, e.g. ``LD_PRELOAD=libjemalloc.so.2``; loading it later with
+    ctypes would not replace malloc for memory already in use.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return ctypes.CDLL("libc.so.6").malloc_trim
+    except (OSError, AttributeError):
+        return None
 
 
 class MemoryOptimizer:
@@ -103,36 +228,68 @@ class MemoryOptimizer:
     def __init__(self):
         self.memory_threshold = 0.85  # 85% memory usage threshold
         self.gc_threshold = 0.90  # 90% memory usage triggers aggressive GC
+        self._pid = os.getpid()
+        self._proc = psutil.Process(self._pid)
+        self._rss_cache = (-_RSS_TTL, 0.0)  # (monotonic time, rss MB)
+        self._gc_min_interval = 5.0  # seconds between forced collections
+        self._last_gc = -self._gc_min_interval
 
     def get_memory_usage(self) -> float:
         """Get current memory usage as percentage."""
         return psutil.virtual_memory().percent / 100.0
 
+    def _process(self) -> psutil.Process:
+        """Return the psutil handle for the current process.
+
+        The handle pins a pid, so a forked child rebuilds it (and drops the
+        parent's cached RSS) instead of reporting the parent's memory.
+        """
+        pid = os.getpid()
+        if pid != self._pid:
+            self._pid = pid
+            self._proc = psutil.Process(pid)
+            self._rss_cache = (-_RSS_TTL, 0.0)
+        return self._proc
+
     def get_memory_usage_mb(self) -> float:
-        """Get current memory usage in MB."""
-        return psutil.Process().memory_info().rss / (1024 * 1024)
+        """Get current memory usage in MB (sampled at most every 100ms)."""
+        proc = self._process()
+        sampled_at, rss_mb = self._rss_cache
+        now = time.monotonic()
+        if now - sampled_at < _RSS_TTL:
+            return rss_mb
+
+        rss_mb = proc.memory_info().rss / (1024 * 1024)
+        self._rss_cache = (now, rss_mb)
+        return rss_mb
+
+    def _os_peak_mb(self) -> float:
+        """Lifetime peak working set in MB as tracked by Windows, else 0."""
+        if not _HAS_PEAK_WSET:
+            return 0.0
+        return self._process().memory_info().peak_wset / (1024 * 1024)
 
     @contextmanager
     def memory_monitoring(self, operation_name: str):
-        """Context manager for monitoring memory usage."""
-        initial_memory = self.get_memory_usage_mb()
-        peak_memory = initial_memory
+        """Context manager for monitoring memory usage.
 
-        def monitor_memory():
-            nonlocal peak_memory
-            current = self.get_memory_usage_mb()
-            if current > peak_memory:
-                peak_memory = current
-
-        # Start memory monitoring
-        monitor_thread = threading.Thread(
-            target=lambda: monitor_memory(), daemon=True)
-        monitor_thread.start()
+        Yields a tracker: call it for the peak so far, and call its
+        ``update_peak()`` at checkpoints inside the block.
+        """
+        initial_memory = self.get_memory_usage_mb()
+        initial_os_peak = self._os_peak_mb()
+        tracker = _PeakMemory(self.get_memory_usage_mb, initial_memory)
 
         try:
-            yield lambda: peak_memory
+            yield tracker
         finally:
             final_memory = self.get_memory_usage_mb()
+            # A lifetime peak that grew inside the block is the block's exact
+            # peak, which sampling at checkpoints can miss
+            final_os_peak = self._os_peak_mb()
+            if final_os_peak > initial_os_peak:
+                tracker.peak = max(tracker.peak, final_os_peak)
+            peak_memory = tracker.peak = max(tracker.peak, final_memory)
             memory_delta = final_memory - initial_memory
 
             log.debug(
@@ -144,28 +301,43 @@ class MemoryOptimizer:
                 memory_delta,
             )
 
-            # Trigger garbage collection if memory usage is high
+            # Optimize if memory usage is high (rate-limited there)
             if self.get_memory_usage() > self.gc_threshold:
-                log.info(
-                    "🧹 High memory usage detected, triggering garbage collection")
-                collected = gc.collect()
-                log.debug("Garbage collection freed %d objects", collected)
+                self.optimize_memory_usage()
 
     def optimize_memory_usage(self) -> None:
         """Optimize current memory usage."""
         current_usage = self.get_memory_usage()
 
         if current_usage > self.memory_threshold:
+            # A full collection costs hundreds of ms on a large heap, so
+            # force at most one per _gc_min_interval
+            now = time.monotonic()
+            if now - self._last_gc < self._gc_min_interval:
+                log.debug(
+                    "Skipping memory optimization, last collection %.1fs ago",
+                    now - self._last_gc,
+                )
+                return
+            self._last_gc = now
+
             log.info(
                 "🧹 Memory usage at %.1f%%, optimizing...",
                 current_usage * 100)
 
             # Force garbage collection
             collected = gc.collect()
+            log.debug("Garbage collection freed %d objects", collected)
 
             # Clear caches if available
             self._clear_internal_caches()
 
+            # Hand freed heap pages back to the OS instead of keeping them
+            # mapped in fragmented arenas
+            malloc_trim = _malloc_trim()
+            if malloc_trim is not None:
+                malloc_trim(0)
+
             new_usage = self.get_memory_usage()
             reduction = (current_usage - new_usage) * 100
 
@@ -180,24 +352,74 @@ class MemoryOptimizer:
 
     def _clear_internal_caches(self) -> None:
         """Clear internal caches to free memory."""
-        # Clear HTTP connection pools
-        import requests
-
-        requests.Session().close()
-
-        # Clear any other internal caches
         if hasattr(sys, "_clear_type_cache"):
             sys._clear_type_cache()
 
 
+class AdaptiveGCTuner:
+    """Scales the generation-0 GC threshold with the square root of the live heap.
+
+    Short-lived ETL records make gen-0 collections frequent; tying the
+    threshold to sqrt(live allocations) keeps their cost proportional as the
+    heap grows. ``sys.getallocatedblocks()`` is the O(1) live-heap measure.
+    A boost factor, adjusted from the measured gen-0 collection rate between
+    tunes, raises the threshold further while allocation is heavy and decays
+    back once it calms down. ``gc.set_threshold`` is process-wide, so the
+    tuner never goes below the threshold in effect when it was created.
+    """
+
+    def __init__(self, base: int = 11, min_interval: float = 1.0):
+        self.base = base
+        self.min_interval = min_interval
+        self._last_tune = -min_interval
+        self._last_collections = gc.get_stats()[0]["collections"]
+        self._boost = 1.0
+        # Only ever raise gen-0 above what the process started with; the
+        # sqrt-heap figure alone is below CPython's 700 on ordinary heaps
+        self._floor = gc.get_threshold()[0] or _GC_DEFAULT_THRESHOLD0
+
+    def tune(self) -> int:
+        """Update the gen-0 threshold (at most once per ``min_interval``)."""
+        threshold0, threshold1, threshold2 = gc.get_threshold()
+        now = time.monotonic()
+        if now - self._last_tune < self.min_interval:
+            return threshold0
+
+        elapsed = now - self._last_tune
+        self._last_tune = now
+
+        collections = gc.get_stats()[0]["collections"]
+        rate = (collections - self._last_collections) / elapsed
+        self._last_collections = collections
+        heap_threshold = math.sqrt(max(1, sys.getallocatedblocks())) + self.base
+        # Collections scale inversely with the threshold, so scaling the
+        # boost by rate/target (at most 4x up or 2x down per tune) moves the
+        # rate towards the target without overshooting
+        step = min(4.0, max(0.5, rate / _GC_TARGET_RATE))
+        self._boost = min(
+            _GC_MAX_THRESHOLD0 / heap_threshold, max(1.0, self._boost * step)
+        )
+
+        threshold0 = max(self._floor, int(heap_threshold * self._boost))
+        gc.set_threshold(threshold0, threshold1, threshold2)
+        return threshold0
+
+
 class ConcurrencyOptimizer:
     """Optimizes concurrency based on system resources and workload characteristics."""
 
     def __init__(self):
         self.cpu_count = psutil.cpu_count() or 1
         self.memory_gb = psutil.virtual_memory().total / (1024**3)
-        self.optimal_workers_cache: Dict[str, int] = {}
         self.ROOT_PATH = os.path.abspath(os.sep)
+        # Prime cpu_percent so later non-blocking calls return a real delta
+        psutil.cpu_percent(interval=None)
+        self._res_cache: Tuple[float, Optional[SystemResources]] = (
+            -_RESOURCES_TTL,
+            None,
+        )
+        self._disk_cache: Tuple[float, float] = (-_DISK_TTL, 0.0)
+        self._net_cache: Tuple[float, int] = (-_NET_TTL, 0)
 
     def calculate_optimal_workers(
         self,
@@ -206,63 +428,25 @@ class ConcurrencyOptimizer:
         item_complexity: str = "medium",
         memory_per_item_mb: float = 10.0,
     ) -> int:
-        """Calculate optimal number of workers for a given operation."""
+        """Calculate optimal number of workers for a given operation.
 
-        # Check cache first
-        cache_key = (
-            f"{operation_type}_{workload_size}_{item_complexity}_{memory_per_item_mb}"
-        )
-        if cache_key in self.optimal_workers_cache:
-            return self.optimal_workers_cache[cache_key]
-
-        # Get current system resources
+        Inputs are bucketed (workload size to the next power of two, memory
+        figures to 0.5 MB / 0.5 GB steps) so the memoized core is reused
+        across similar workloads and resource states.
+        """
         resources = self._get_current_resources()
 
-        # Network I/O can be highly concurrent
-        # CPU-intensive tasks should match CPU cores
-        # Mixed workload - balance between I/O and CPU
-        # Default conservative approach
-        base_workers_map = {
-            "network_io": lambda: min(workload_size, self.cpu_count * 4),
-            "cpu_intensive": lambda: min(workload_size, self.cpu_count),
-            "mixed": lambda: min(workload_size, self.cpu_count * 2),
-        }
-        base_workers = base_workers_map.get(
-            operation_type, lambda: min(workload_size, self.cpu_count)
-        )()
-
-        # Adjust for item complexity
-        complexity_multiplier = {
-            "low": 1.5,
-            "medium": 1.0,
-            "high": 0.7,
-            "very_high": 0.5,
-        }.get(item_complexity, 1.0)
-
-        base_workers = int(base_workers * complexity_multiplier)
-
-        # Adjust for memory constraints
-        total_memory_needed = workload_size * memory_per_item_mb / 1024  # GB
-        if total_memory_needed > resources.memory_available_gb * 0.8:
-            # Memory-constrained, reduce workers
-            memory_limited_workers = int(
-                resources.memory_available_gb * 0.8 * 1024 / memory_per_item_mb
-            )
-            base_workers = min(base_workers, memory_limited_workers)
-
-        # Adjust for current system pressure
-        if resources.pressure_level == "critical":
-            base_workers = max(1, base_workers // 4)
-        elif resources.pressure_level == "high":
-            base_workers = max(1, base_workers // 2)
-        elif resources.pressure_level == "moderate":
-            base_workers = max(1, int(base_workers * 0.75))
-
-        # Ensure minimum and maximum bounds
-        optimal_workers = max(1, min(base_workers, 20))  # Max 20 workers
-
-        # Cache the result
-        self.optimal_workers_cache[cache_key] = optimal_workers
+        optimal_workers = self._compute_workers(
+            operation_type,
+            1 << max(0, workload_size - 1).bit_length(),
+            item_complexity,
+            max(0.5, round(memory_per_item_mb * 2) / 2),
+            resources.pressure_level,
+            int(resources.memory_available_gb * 2) / 2,
+            self.cpu_count,
+        )
+        # Bucketing rounds the workload up; never use more workers than tasks
+        optimal_workers = max(1, min(optimal_workers, workload_size))
 
         log.debug(
             "Calculated optimal workers for %s: %d (workload=%d, complexity=%s, memory=%.1fMB/item, pressure=%s)",
@@ -276,21 +460,79 @@ class ConcurrencyOptimizer:
 
         return optimal_workers
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _compute_workers(
+        operation_type: str,
+        workload_size: int,
+        item_complexity: str,
+        memory_per_item_mb: float,
+        pressure_level: str,
+        memory_available_gb: float,
+        cpu_count: int,
+    ) -> int:
+        """Worker count for bucketed workload and resource inputs.
+
+        The ideal count balances throughput against memory cost:
+        sqrt(available GB * CPUs / GB per item), scaled by operation type and
+        item complexity and damped once by system pressure. It is then
+        bounded by the workload, a per-CPU ceiling and the global maximum.
+        """
+        per_cpu, scale = _OPERATION_PROFILES.get(
+            operation_type, _DEFAULT_OPERATION_PROFILE
+        )
+        memory_per_item_gb = max(0.01, memory_per_item_mb / 1024)
+        ideal = math.sqrt(
+            max(1.0, memory_available_gb * cpu_count / memory_per_item_gb)
+        )
+
+        workers = ideal * scale * _COMPLEXITY_MULTIPLIERS.get(item_complexity, 1.0)
+        workers *= 1 - 0.3 * _PRESSURE_INDEX.get(pressure_level, 0.0)
+
+        return max(
+            1, min(int(workers), workload_size, cpu_count * per_cpu, _MAX_WORKERS)
+        )
+
     def _get_current_resources(self) -> SystemResources:
-        """Get current system resource usage."""
-        memory = psutil.virtual_memory()
-        root_path = getattr(
-            self, "ROOT_PATH", Path.cwd().anchor
-        )  # Use precomputed static root path
-        disk = psutil.disk_usage(root_path)
+        """Get current system resource usage (sampled at most once a second)."""
+        sampled_at, resources = self._res_cache
+        now = time.monotonic()
+        if resources is not None and now - sampled_at < _RESOURCES_TTL:
+            return resources
 
-        return SystemResources(
-            cpu_percent=psutil.cpu_percent(interval=0.1),
+        memory = psutil.virtual_memory()
+        resources = SystemResources(
+            cpu_percent=psutil.cpu_percent(interval=None),
             memory_percent=memory.percent,
             memory_available_gb=memory.available / (1024**3),
-            disk_free_gb=disk.free / (1024**3),
-            network_connections=len(psutil.net_connections()),
+            disk_free_gb=self._get_disk_free_gb(now),
+            network_connections=self._get_net_connections(now),
         )
+        self._res_cache = (now, resources)
+        return resources
+
+    def _get_disk_free_gb(self, now: float) -> float:
+        """Free space on the root volume, refreshed every 30 seconds."""
+        sampled_at, free_gb = self._disk_cache
+        if now - sampled_at >= _DISK_TTL:
+            try:
+                free_gb = psutil.disk_usage(self.ROOT_PATH).free / (1024**3)
+            except OSError as exc:
+                # Keep the last reading; retry after the next TTL window
+                log.debug("Disk usage unavailable for %s: %s", self.ROOT_PATH, exc)
+            self._disk_cache = (now, free_gb)
+        return free_gb
+
+    def _get_net_connections(self, now: float) -> int:
+        """System-wide TCP connection count, refreshed every 30 seconds."""
+        sampled_at, connections = self._net_cache
+        if now - sampled_at >= _NET_TTL:
+            try:
+                connections = len(psutil.net_connections(kind="tcp"))
+            except (psutil.AccessDenied, OSError) as exc:
+                log.debug("Connection count unavailable: %s", exc)
+            self._net_cache = (now, connections)
+        return connections
 
     def adaptive_worker_adjustment(
         self,
@@ -298,35 +540,55 @@ class ConcurrencyOptimizer:
         performance_metrics: List[PerformanceMetrics],
         target_cpu_usage: float = 0.75,
     ) -> int:
-        """Adaptively adjust worker count based on performance metrics."""
+        """Adaptively adjust worker count based on performance metrics.
+
+        Gradient-style limiter: the best per-item latency seen in the history
+        is compared with the recent average. At baseline latency the limit
+        grows by sqrt(workers); as latency rises the gradient (0.5-1.0)
+        shrinks it multiplicatively. System pressure and CPU saturation
+        override growth.
+        """
 
         if not performance_metrics:
             return current_workers
 
-        # Analyze recent performance
-        recent_metrics = performance_metrics[-5:]  # Last 5 operations
-        avg_cpu = sum(m.cpu_percent for m in recent_metrics) / \
-            len(recent_metrics)
-        avg_throughput = sum(
-            m.throughput_items_per_sec for m in recent_metrics) / len(recent_metrics)
+        # Per-item worker latency: seconds each worker spent per item
+        min_latency = math.inf
+        recent_latency = recent_cpu = 0.0
+        recent_count = 0
+        # Newest first, so the first 5 usable entries form the recent window
+        for m in reversed(performance_metrics):
+            if m.items_processed <= 0 or m.duration <= 0:
+                continue
+            latency = m.duration * m.worker_count / m.items_processed
+            if latency < min_latency:
+                min_latency = latency
+            if recent_count < 5:
+                recent_latency += latency
+                recent_cpu += m.cpu_percent
+                recent_count += 1
+
+        if not recent_count:
+            return current_workers
+        recent_latency /= recent_count
+        avg_cpu = recent_cpu / recent_count / 100
 
         # Get current system state
         resources = self._get_current_resources()
 
-        # Adjustment logic
-        if resources.is_under_pressure:
-            # System under pressure, reduce workers
-            new_workers = max(1, int(current_workers * 0.8))
+        if resources.pressure_level == "critical":
+            # Back off hard so queued work waits instead of adding load
+            new_workers = max(1, current_workers // 2)
             log.info(
-                "🔻 System under pressure, reducing workers: %d → %d",
+                "🔻 Critical system pressure, halving workers: %d → %d",
                 current_workers,
                 new_workers,
             )
-        elif avg_cpu < target_cpu_usage * 0.7 and avg_throughput > 0:
-            # CPU underutilized, can increase workers
-            new_workers = min(current_workers + 1, 20)
+        elif resources.is_under_pressure:
+            # System under pressure, reduce workers
+            new_workers = max(1, int(current_workers * 0.8))
             log.info(
-                "🔺 CPU underutilized, increasing workers: %d → %d",
+                "🔻 System under pressure, reducing workers: %d → %d",
                 current_workers,
                 new_workers,
             )
@@ -339,12 +601,161 @@ class ConcurrencyOptimizer:
                 new_workers,
             )
         else:
-            # Performance is stable, no change needed
-            new_workers = current_workers
+            gradient = max(0.5, min(1.0, min_latency / recent_latency))
+            new_workers = max(
+                1,
+                min(int(current_workers * gradient + math.sqrt(current_workers)), _MAX_WORKERS),
+            )
+            if new_workers != current_workers:
+                log.info(
+                    "%s Per-item latency %.2fx baseline, adjusting workers: %d → %d",
+                    "🔺" if new_workers > current_workers else "🔻",
+                    recent_latency / min_latency,
+                    current_workers,
+                    new_workers,
+                )
 
         return new_workers
 
 
+def _busy_percent(before: Any, after: Any) -> float:
+    """System CPU busy percentage between two ``psutil.cpu_times()`` samples."""
+    total = sum(after) - sum(before)
+    if total <= 0:
+        return 0.0
+    idle = after.idle - before.idle
+    idle += getattr(after, "iowait", 0.0) - getattr(before, "iowait", 0.0)
+    return max(0.0, min(100.0, 100.0 * (1 - idle / total)))
+
+
+def _is_picklable(task: Callable) -> bool:
+    """Whether ``task`` can be shipped to a worker process."""
+    try:
+        pickle.dumps(task)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+
+def _bounded_completions(
+    executor: Executor, tasks: List[Callable], max_in_flight: int
+) -> Iterator[Future]:
+    """Yield futures as they complete, keeping at most ``max_in_flight`` submitted.
+
+    Tasks are submitted lazily as earlier ones finish, so only O(workers)
+    futures exist at any time instead of one per task.
+    """
+    pending = iter(tasks)
+    in_flight = {executor.submit(task) for task in islice(pending, max_in_flight)}
+
+    while in_flight:
+        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+        for task in islice(pending, len(done)):
+            in_flight.add(executor.submit(task))
+        yield from done
+
+
+def _future_outcomes(futures: Iterator[Future]) -> Iterator[Tuple[Any, Optional[BaseException]]]:
+    """Map completed futures to ``(result, error)`` pairs."""
+    for future in futures:
+        error = future.exception()
+        yield (None, error) if error is not None else (future.result(), None)
+
+
+class _IOWorkerPool:
+    """Fixed set of threads draining one task queue, for blocking network I/O.
+
+    Tasks are queued as bare callables and ``(result, error)`` pairs come back
+    on a per-run queue, skipping the Future ThreadPoolExecutor allocates for
+    every submission.
+    """
+
+    def __init__(self, max_workers: int):
+        self._tasks: queue.SimpleQueue = queue.SimpleQueue()
+        self._threads = [
+            threading.Thread(target=self._work, name=f"etl-io-{n}", daemon=True)
+            for n in range(max_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _work(self) -> None:
+        get = self._tasks.get
+        while True:
+            item = get()
+            if item is None:
+                return
+            task, outcomes = item
+            try:
+                outcomes.put((task(), None))
+            except BaseException as e:
+                outcomes.put((None, e))
+
+    def run(self, tasks: List[Callable]) -> Iterator[Tuple[Any, Optional[BaseException]]]:
+        """Queue every task and yield outcomes in completion order."""
+        outcomes: queue.SimpleQueue = queue.SimpleQueue()
+        put = self._tasks.put
+        for task in tasks:
+            put((task, outcomes))
+        get = outcomes.get
+        for _ in range(len(tasks)):
+            yield get()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers once queued tasks are drained."""
+        for _ in self._threads:
+            self._tasks.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+
+async def _gather_bounded(tasks: List[Callable], limit: int) -> List[Any]:
+    """Await coroutine tasks with at most ``limit`` running at once.
+
+    A failed task leaves ``None`` in its slot, as on the thread pool path.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(task: Callable) -> Any:
+        async with semaphore:
+            try:
+                return await task()
+            except Exception as e:
+                log.error("Task failed: %s", e)
+                return None
+
+    return await asyncio.gather(*(run(task) for task in tasks))
+
+
+def _run_coroutines(tasks: List[Callable], limit: int) -> List[Any]:
+    """Run coroutine tasks to completion on a fresh event loop.
+
+    When the caller is already inside a running loop, the new loop is driven
+    from a helper thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_gather_bounded(tasks, limit))
+    with ThreadPoolExecutor(max_workers=1) as runner:
+        return runner.submit(asyncio.run, _gather_bounded(tasks, limit)).result()
+
+
+# Executors closed at interpreter exit. Weak, so registration does not keep
+# an executor (and its worker pool) alive.
+_LIVE_EXECUTORS: "weakref.WeakSet[AdaptiveExecutor]" = weakref.WeakSet()
+
+
+def _close_live_executors() -> None:
+    """Shut down the pools of executors still alive at interpreter exit."""
+    for executor in list(_LIVE_EXECUTORS):
+        executor.close()
+
+
+atexit.register(_close_live_executors)
+
+
 class AdaptiveExecutor:
     """Adaptive thread/process pool executor that optimizes performance dynamically."""
 
@@ -352,11 +763,110 @@ class AdaptiveExecutor:
         self.operation_type = operation_type
         self.concurrency_optimizer = ConcurrencyOptimizer()
         self.memory_optimizer = MemoryOptimizer()
-        self.performance_history: List[PerformanceMetrics] = []
+        # Last 20 workloads; older entries fall off automatically
+        self.performance_history: Deque[PerformanceMetrics] = deque(maxlen=20)
         self.current_executor: Optional[
-            Union[ThreadPoolExecutor, ProcessPoolExecutor]
+            Union[ThreadPoolExecutor, ProcessPoolExecutor, _IOWorkerPool]
         ] = None
         self.current_workers = 1
+        self._pool: Optional[
+            Union[ThreadPoolExecutor, ProcessPoolExecutor, _IOWorkerPool]
+        ] = None
+        self._pool_workers = 0
+        self._pool_is_process = False
+        self._pool_finalizer: Optional[weakref.finalize] = None
+        # Running workloads per pool. A pool that is replaced or closed while
+        # in use is shut down by the last workload to release it.
+        self._pool_refs: Dict[Any, int] = {}
+        # Guards the pool slot and refcounts only, never a running workload
+        self._pool_lock = threading.Lock()
+        _LIVE_EXECUTORS.add(self)
+
+    def _acquire_pool(
+        self, workers: int, use_processes: bool
+    ) -> Union[ThreadPoolExecutor, ProcessPoolExecutor, _IOWorkerPool]:
+        """Return the persistent pool, recreating it only when its shape changes.
+
+        Registers the caller as a user of the pool; every call must be paired
+        with ``_release_pool``.
+        """
+        idle = None
+        with self._pool_lock:
+            pool = self._pool
+            if (
+                pool is None
+                or self._pool_workers != workers
+                or self._pool_is_process != use_processes
+            ):
+                idle = self._detach_pool()
+                pool = self._new_pool(workers, use_processes)
+            self._pool_refs[pool] = self._pool_refs.get(pool, 0) + 1
+
+        if idle is not None:
+            idle.shutdown(wait=True)
+        return pool
+
+    def _release_pool(
+        self, pool: Union[ThreadPoolExecutor, ProcessPoolExecutor, _IOWorkerPool]
+    ) -> None:
+        """Drop a user of ``pool``, shutting it down if it was retired meanwhile."""
+        with self._pool_lock:
+            users = self._pool_refs[pool] - 1
+            if users:
+                self._pool_refs[pool] = users
+                return
+            del self._pool_refs[pool]
+            if pool is self._pool:
+                return
+        pool.shutdown(wait=True)
+
+    def _new_pool(
+        self, workers: int, use_processes: bool
+    ) -> Union[ThreadPoolExecutor, ProcessPoolExecutor, _IOWorkerPool]:
+        """Create and install a pool (caller holds ``_pool_lock``)."""
+        if use_processes:
+            executor_class = ProcessPoolExecutor
+        elif self.operation_type == "network_io":
+            # Blocking I/O tasks go through a plain queue-fed thread pool
+            executor_class = _IOWorkerPool
+        else:
+            executor_class = ThreadPoolExecutor
+        pool = executor_class(max_workers=workers)
+        self._pool = pool
+        self._pool_workers = workers
+        self._pool_is_process = use_processes
+        # Shut the pool down if this executor is dropped without close()
+        self._pool_finalizer = weakref.finalize(self, pool.shutdown, wait=False)
+        return pool
+
+    def _detach_pool(
+        self,
+    ) -> Optional[Union[ThreadPoolExecutor, ProcessPoolExecutor, _IOWorkerPool]]:
+        """Retire the current pool (caller holds ``_pool_lock``).
+
+        Returns the pool if nobody is using it and the caller should shut it
+        down; a pool still in use is left to its last ``_release_pool``.
+        """
+        pool = self._pool
+        if pool is None:
+            return None
+        if self._pool_finalizer is not None:
+            self._pool_finalizer.detach()
+            self._pool_finalizer = None
+        self._pool = None
+        self._pool_workers = 0
+        return None if pool in self._pool_refs else pool
+
+    def close(self) -> None:
+        """Shut down the persistent worker pool.
+
+        A pool still used by a running workload is shut down as soon as that
+        workload finishes. Called for every live executor at interpreter exit.
+        """
+        with self._pool_lock:
+            pool = self._detach_pool()
+        if pool is not None:
+            pool.shutdown(wait=True)
 
     def execute_workload(
         self,
@@ -371,7 +881,9 @@ class AdaptiveExecutor:
         if not tasks:
             return []
 
-        task_args = task_args or [() for _ in tasks]
+        # Bind arguments once so submission passes bare callables
+        if task_args is not None:
+            tasks = [functools.partial(task, *args) for task, args in zip(tasks, task_args)]
         workload_size = len(tasks)
 
         log.info(
@@ -395,47 +907,89 @@ class AdaptiveExecutor:
                 performance_metrics=self.performance_history,
             )
 
+        # Worker processes only pay off for CPU-bound work and cost tens of MB
+        # RSS each, so I/O-bound workloads stay on threads
+        if use_processes:
+            if self.operation_type not in _PROCESS_OPERATIONS:
+                log.warning(
+                    "⚠️ Process pool requested for %s workload '%s'; using threads",
+                    self.operation_type,
+                    workload_name,
+                )
+                use_processes = False
+            elif not _is_picklable(tasks[0]):
+                log.warning(
+                    "⚠️ Tasks for '%s' cannot be sent to worker processes; using threads",
+                    workload_name,
+                )
+                use_processes = False
+            else:
+                memory_capped = int(
+                    psutil.virtual_memory().available // _PROCESS_WORKER_HEADROOM
+                )
+                optimal_workers = max(
+                    1, min(optimal_workers, self.concurrency_optimizer.cpu_count, memory_capped)
+                )
+
         self.current_workers = optimal_workers
 
-        # Start performance monitoring
+        # Async network tasks run as coroutines instead of occupying threads
+        use_asyncio = self.operation_type == "network_io" and all(
+            asyncio.iscoroutinefunction(task) for task in tasks
+        )
+
+        # Start performance monitoring; the wall-clock start is only a
+        # timestamp, the duration comes from the monotonic perf_counter
         start_time = time.time()
+        start_counter = time.perf_counter()
         start_memory = self.memory_optimizer.get_memory_usage_mb()
-        start_cpu = psutil.cpu_percent()
+        # Private cpu_times() snapshots, so the shared cpu_percent() delta
+        # that ConcurrencyOptimizer samples is not reset by every workload
+        start_cpu_times = psutil.cpu_times()
 
         results = []
 
         with self.memory_optimizer.memory_monitoring(workload_name) as get_peak_memory:
-            try:
-                # Choose executor type
-                executor_class = (
-                    ProcessPoolExecutor if use_processes else ThreadPoolExecutor)
-
-                with executor_class(max_workers=optimal_workers) as executor:
-                    self.current_executor = executor
-
-                    # Submit all tasks
-                    future_to_task = {
-                        executor.submit(task, *args): (i, task)
-                        for i, (task, args) in enumerate(zip(tasks, task_args))
-                    }
-
-                    # Collect results with progress monitoring
-                    for i, future in enumerate(as_completed(future_to_task)):
+            if use_asyncio:
+                # Coroutines share one event loop; the semaphore replaces the
+                # pool's worker bound
+                results = _run_coroutines(tasks, optimal_workers)
+            else:
+                # Reuse the pool unless the worker count or kind changed. The
+                # lock is only held to look the pool up, so concurrent and
+                # nested workloads share it.
+                executor = self._acquire_pool(optimal_workers, use_processes)
+                self.current_executor = executor
+                try:
+                    if isinstance(executor, _IOWorkerPool):
+                        outcomes = executor.run(tasks)
+                    else:
+                        # Submit with at most two tasks per worker in flight
+                        outcomes = _future_outcomes(
+                            _bounded_completions(executor, tasks, optimal_workers * 2)
+                        )
+
+                    # Collect results, checkpointing every 10% or every 10
+                    # tasks, whichever comes first
+                    checkpoint_every = min(10, max(1, workload_size // 10))
+                    debug_enabled = log.isEnabledFor(logging.DEBUG)
+                    for i, (result, error) in enumerate(outcomes, 1):
                         try:
-                            result = future.result()
+                            if error is not None:
+                                raise error
                             results.append(result)
 
-                            # Log progress every 10% or every 10 items
-                            if (i + 1) % max(1, workload_size // 10) == 0 or (
-                                i + 1
-                            ) % 10 == 0:
-                                progress = (i + 1) / workload_size * 100
-                                log.debug(
-                                    "Progress: %.1f%% (%d/%d tasks completed)",
-                                    progress,
-                                    i + 1,
-                                    workload_size,
-                                )
+                            if i % checkpoint_every == 0:
+                                if debug_enabled:
+                                    log.debug(
+                                        "Progress: %.1f%% (%d/%d tasks completed)",
+                                        i / workload_size * 100,
+                                        i,
+                                        workload_size,
+                                    )
+
+                                get_peak_memory.update_peak()
+                                get_gc_tuner().tune()
 
                                 # Check for memory pressure and optimize if
                                 # needed
@@ -446,15 +1000,16 @@ class AdaptiveExecutor:
                             log.error("Task failed: %s", e)
                             results.append(None)  # Placeholder for failed task
 
-            finally:
-                self.current_executor = None
+                finally:
+                    self.current_executor = None
+                    self._release_pool(executor)
 
         # Calculate performance metrics
-        end_time = time.time()
-        duration = end_time - start_time
+        duration = time.perf_counter() - start_counter
+        end_time = start_time + duration
         end_memory = self.memory_optimizer.get_memory_usage_mb()
         peak_memory = get_peak_memory()
-        end_cpu = psutil.cpu_percent()
+        cpu_percent = _busy_percent(start_cpu_times, psutil.cpu_times())
 
         metrics = PerformanceMetrics(
             operation_name=workload_name,
@@ -464,15 +1019,13 @@ class AdaptiveExecutor:
             memory_before=start_memory,
             memory_after=end_memory,
             memory_peak=peak_memory,
-            cpu_percent=(start_cpu + end_cpu) / 2,
+            cpu_percent=cpu_percent,
             worker_count=optimal_workers,
-            items_processed=len([r for r in results if r is not None]),
+            items_processed=len(results) - results.count(None),
         )
 
         # Store performance history (keep last 20 entries)
         self.performance_history.append(metrics)
-        if len(self.performance_history) > 20:
-            self.performance_history.pop(0)
 
         # Log performance summary
         log.info(
@@ -492,24 +1045,24 @@ class AdaptiveExecutor:
         if not self.performance_history:
             return {"message": "No performance data available"}
 
-        recent_metrics = self.performance_history[-10:]  # Last 10 operations
+        # Last 10 operations, read from the end without copying the history
+        recent_metrics = list(islice(reversed(self.performance_history), 10))
+
+        duration = throughput = workers = efficiency = 0.0
+        for m in recent_metrics:
+            duration += m.duration
+            throughput += m.throughput_items_per_sec
+            workers += m.worker_count
+            efficiency += m.memory_efficiency
+        count = len(recent_metrics)
 
         return {
-            "total_operations": len(
-                self.performance_history),
-            "recent_operations": len(recent_metrics),
-            "average_duration": sum(
-                m.duration for m in recent_metrics) /
-            len(recent_metrics),
-            "average_throughput": sum(
-                m.throughput_items_per_sec for m in recent_metrics) /
-            len(recent_metrics),
-            "average_workers": sum(
-                m.worker_count for m in recent_metrics) /
-            len(recent_metrics),
-            "memory_efficiency": sum(
-                m.memory_efficiency for m in recent_metrics) /
-            len(recent_metrics),
+            "total_operations": len(self.performance_history),
+            "recent_operations": count,
+            "average_duration": duration / count,
+            "average_throughput": throughput / count,
+            "average_workers": workers / count,
+            "memory_efficiency": efficiency / count,
             "current_workers": self.current_workers,
         }
 
@@ -526,10 +1079,37 @@ class BatchProcessor:
             total_items: int,
             item_size_mb: float,
             processing_overhead: float = 1.5) -> int:
-        """Calculate optimal batch size based on memory constraints."""
+        """Calculate optimal batch size based on memory constraints.
+
+        Item size is rounded to 1/16 MB so the memoized core is reused.
+        """
+        optimal_batch = self._compute_batch_size(
+            total_items,
+            max(0.0625, round(item_size_mb * 16) / 16),
+            processing_overhead,
+            self.max_memory_mb,
+        )
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Calculated optimal batch size: %d items (%.1fMB per item, %.1fMB available)",
+                optimal_batch,
+                item_size_mb,
+                self.max_memory_mb / processing_overhead,
+            )
 
+        return optimal_batch
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _compute_batch_size(
+            total_items: int,
+            item_size_mb: float,
+            processing_overhead: float,
+            max_memory_mb: float) -> int:
+        """Batch size for quantized item size and memory budget."""
         # Calculate how many items fit in memory
-        available_memory = self.max_memory_mb / processing_overhead
+        available_memory = max_memory_mb / processing_overhead
         items_per_batch = int(available_memory / item_size_mb)
 
         # Ensure batch size is reasonable
@@ -537,25 +1117,20 @@ class BatchProcessor:
         # Never more than 1000 items per batch
         max_batch = min(1000, total_items)
 
-        optimal_batch = max(min_batch, min(items_per_batch, max_batch))
-
-        log.debug(
-            "Calculated optimal batch size: %d items (%.1fMB per item, %.1fMB available)",
-            optimal_batch,
-            item_size_mb,
-            available_memory,
-        )
-
-        return optimal_batch
+        return max(min_batch, min(items_per_batch, max_batch))
 
     def process_in_batches(
         self,
-        items: List[Any],
+        items: Collection[Any],
         processor_func: Callable[[List[Any]], List[Any]],
         item_size_mb: float = 1.0,
         progress_callback: Optional[Callable[[int, int], None]] = None,
     ) -> List[Any]:
-        """Process items in optimal batches to manage memory usage."""
+        """Process items in optimal batches to manage memory usage.
+
+        ``items`` can be any sized collection (list, tuple, deque, set, ...);
+        batches are drawn from a single iterator rather than by slicing.
+        """
 
         if not items:
             return []
@@ -572,20 +1147,22 @@ class BatchProcessor:
         results = []
         processed_count = 0
 
-        for i in range(0, total_items, batch_size):
-            batch = items[i: i + batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (total_items + batch_size - 1) // batch_size
+        total_batches = (total_items + batch_size - 1) // batch_size
 
-            log.debug(
-                "Processing batch %d/%d (%d items)",
-                batch_num,
-                total_batches,
-                len(batch),
-            )
+        item_iter = iter(items)
+
+        # One monitored region for the whole run, sampled after each batch
+        with self.memory_optimizer.memory_monitoring("batch_processing") as tracker:
+            for batch_num in range(1, total_batches + 1):
+                batch = list(islice(item_iter, batch_size))
+
+                log.debug(
+                    "Processing batch %d/%d (%d items)",
+                    batch_num,
+                    total_batches,
+                    len(batch),
+                )
 
-            # Process batch with memory monitoring
-            with self.memory_optimizer.memory_monitoring(f"batch_{batch_num}"):
                 try:
                     batch_results = processor_func(batch)
                     results.extend(batch_results)
@@ -595,8 +1172,13 @@ class BatchProcessor:
                     if progress_callback:
                         progress_callback(processed_count, total_items)
 
+                    tracker.update_peak()
+
                     # Optimize memory after each batch
-                    if self.memory_optimizer.get_memory_usage() > 0.75:
+                    if (
+                        self.memory_optimizer.get_memory_usage()
+                        > self.memory_optimizer.gc_threshold
+                    ):
                         self.memory_optimizer.optimize_memory_usage()
 
                 except Exception as e:
@@ -617,6 +1199,7 @@ class BatchProcessor:
 # Global instances for easy access
 _memory_optimizer = MemoryOptimizer()
 _concurrency_optimizer = ConcurrencyOptimizer()
+_gc_tuner = AdaptiveGCTuner()
 
 
 def get_memory_optimizer() -> MemoryOptimizer:
@@ -629,6 +1212,11 @@ def get_concurrency_optimizer() -> ConcurrencyOptimizer:
     return _concurrency_optimizer
 
 
+def get_gc_tuner() -> AdaptiveGCTuner:
+    """Get global GC threshold tuner instance."""
+    return _gc_tuner
+
+
 @contextmanager
 def performance_optimization():
     """Context manager for automatic performance optimization."""
@@ -645,21 +1233,25 @@ def performance_optimization():
 
 
 def optimize_for_production():
-    """Apply production-ready performance optimizations."""
+    """Apply production-ready performance optimizations.
+
+    Ends by freezing every object alive at that point into the GC's permanent
+    generation, so later collections stop rescanning setup state. Modules and
+    globals created after this call are not frozen.
+    """
 
     log.info("🚀 Applying production performance optimizations...")
 
     # Garbage collection tuning
-    import gc
-
-    gc.set_threshold(700, 10, 10)  # More aggressive garbage collection
+    threshold0 = get_gc_tuner().tune()
+    log.debug("GC generation-0 threshold set to %d", threshold0)
 
     # Memory optimization
     memory_opt = get_memory_optimizer()
     memory_opt.optimize_memory_usage()
 
     # Log system resources
-    resources = ConcurrencyOptimizer()._get_current_resources()
+    resources = get_concurrency_optimizer()._get_current_resources()
     log.info(
         "📊 System resources: CPU=%.1f%%, Memory=%.1f%% (%.1fGB available), Disk=%.1fGB free",
         resources.cpu_percent,
@@ -668,4 +1260,10 @@ def optimize_for_production():
         resources.disk_free_gb,
     )
 
+    # Collect first so garbage is not frozen, then exempt long-lived setup
+    # objects from future collections
+    gc.collect()
+    gc.freeze()
+    log.debug("Froze %d long-lived objects", gc.get_freeze_count())
+
     log.info("✅ Production optimizations applied")
@@ -1,12 +1,18 @@
 """Error recovery and graceful degradation mechanisms for ETL pipeline."""
 from __future__ import annotations
 
+import array
+import bisect
+import heapq
 import logging
+import random
+import sys
+import threading
 import time
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable, Union, TypeVar
+from typing import Any, Dict, Iterable, List, Optional, Callable, Tuple, Type, Union, TypeVar
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -28,10 +34,28 @@ log = logging.getLogger(__name__)
 T = TypeVar('T')
 
 
+def compute_backoff(
+        attempt: int,
+        base: float = 1.0,
+        cap: float = 60.0) -> float:
+    """Full-jitter backoff: a uniform delay in [0, min(cap, base * 2**attempt)].
+
+    Spreading the whole window keeps many failing callers from retrying in
+    lockstep, which plain exponential delays do.
+    """
+    # Clamp the exponent so huge attempt counts cannot overflow a float
+    return random.uniform(0, min(cap, base * 2.0 ** min(attempt, 63)))
+
+
 class RecoveryStrategy(Enum):
-    """Available recovery strategies."""
+    """Available recovery strategies.
+
+    RETRY callers should wait with ``compute_backoff`` (full jitter) or
+    ``RecoveryAction.sleep_backoff`` between attempts, not a fixed
+    exponential delay.
+    """
     SKIP = "skip"                    # Skip the failed operation
-    RETRY = "retry"                  # Retry with backoff
+    RETRY = "retry"                  # Retry with full-jitter backoff
     FALLBACK = "fallback"           # Use fallback data/method
     PARTIAL = "partial"             # Continue with partial results
     DEGRADE = "degrade"             # Reduce quality/functionality
@@ -39,7 +63,7 @@ class RecoveryStrategy(Enum):
     ABORT = "abort"                 # Stop the pipeline
 
 
-@dataclass
+@dataclass(slots=True)
 class RecoveryAction:
     """Represents a recovery action for a specific error."""
     strategy: RecoveryStrategy
@@ -48,6 +72,7 @@ class RecoveryAction:
     description: str = ""
     priority: int = 0
     metadata: Dict[str, Any] = field(default_factory=dict)
+    retry_attempt: int = 0
 
     def execute(self) -> Any:
         """Execute the recovery action."""
@@ -55,8 +80,12 @@ class RecoveryAction:
             return self.action_func()
         return self.fallback_data
 
+    def sleep_backoff(self) -> None:
+        """Sleep a full-jitter backoff for the current retry attempt."""
+        time.sleep(compute_backoff(self.retry_attempt))
+
 
-@dataclass
+@dataclass(slots=True)
 class RecoveryResult:
     """Result of a recovery operation."""
     success: bool
@@ -67,13 +96,29 @@ class RecoveryResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+def _descending_priority(action: RecoveryAction) -> int:
+    """Sort key that orders recovery actions by priority, highest first."""
+    return -action.priority
+
+
 class RecoveryManager:
     """Manages error recovery strategies and graceful degradation."""
 
     def __init__(self):
+        # Both kept sorted by priority (highest first) as they are registered
         self.recovery_strategies: Dict[str, List[RecoveryAction]] = {}
         self.global_strategies: List[RecoveryAction] = []
-        self.recovery_stats: Dict[str, Dict[str, int]] = {}
+        # error type -> specific and global strategies merged in priority
+        # order; cleared whenever a strategy is registered
+        self._merged_cache: Dict[str, Tuple[RecoveryAction, ...]] = {}
+        # Per-context counters as parallel arrays indexed by context id
+        self._ctx_ids: Dict[str, int] = {}
+        self._attempts = array.array('Q')
+        self._successes = array.array('Q')
+        self._failures = array.array('Q')
+        # Guards context id assignment and every counter update; recovery
+        # can run concurrently from worker threads
+        self._stats_lock = threading.Lock()
         self.degradation_level = 0
         self.max_degradation_level = 3
 
@@ -88,8 +133,10 @@ class RecoveryManager:
         metadata: Optional[Dict[str, Any]] = None
     ) -> None:
         """Register a recovery strategy for a specific error type."""
-        error_key = error_type.__name__ if isinstance(
-            error_type, type) else str(error_type)
+        # Interned like class names, so lookups by type(error).__name__
+        # match on identity
+        error_key = sys.intern(error_type.__name__ if isinstance(
+            error_type, type) else str(error_type))
 
         if error_key not in self.recovery_strategies:
             self.recovery_strategies[error_key] = []
@@ -103,17 +150,40 @@ class RecoveryManager:
             metadata=metadata or {}
         )
 
-        self.recovery_strategies[error_key].append(recovery_action)
-
-        # Sort by priority (higher first)
-        self.recovery_strategies[error_key].sort(
-            key=lambda x: x.priority, reverse=True)
+        # Insert by priority (higher first), after existing equal priorities
+        bisect.insort(
+            self.recovery_strategies[error_key],
+            recovery_action,
+            key=_descending_priority)
+        self._merged_cache.clear()
 
         log.debug(
             "📝 Registered recovery strategy for %s: %s",
             error_key,
             strategy.value)
 
+    def register_bulk(
+        self,
+        strategies: Iterable[Tuple[Union[str, Type[Exception]], RecoveryAction]]
+    ) -> None:
+        """Register many (error type, action) pairs, sorting each key once."""
+        touched = set()
+        for error_type, recovery_action in strategies:
+            error_key = sys.intern(error_type.__name__ if isinstance(
+                error_type, type) else str(error_type))
+            self.recovery_strategies.setdefault(error_key, []).append(
+                recovery_action)
+            touched.add(error_key)
+
+        # Stable sort keeps registration order among equal priorities
+        for error_key in touched:
+            self.recovery_strategies[error_key].sort(key=_descending_priority)
+        self._merged_cache.clear()
+
+        log.debug(
+            "📝 Registered recovery strategies for %d error types",
+            len(touched))
+
     def register_global_strategy(
         self,
         strategy: RecoveryStrategy,
@@ -131,8 +201,11 @@ class RecoveryManager:
             priority=priority
         )
 
-        self.global_strategies.append(recovery_action)
-        self.global_strategies.sort(key=lambda x: x.priority, reverse=True)
+        bisect.insort(
+            self.global_strategies,
+            recovery_action,
+            key=_descending_priority)
+        self._merged_cache.clear()
 
         log.debug("📝 Registered global recovery strategy: %s", strategy.value)
 
@@ -146,71 +219,51 @@ class RecoveryManager:
         error_type = type(error).__name__
 
         # Update statistics
-        if operation_context not in self.recovery_stats:
-            self.recovery_stats[operation_context] = {
-                "attempts": 0,
-                "successes": 0,
-                "failures": 0
-            }
-
-        self.recovery_stats[operation_context]["attempts"] += 1
-
+        with self._stats_lock:
+            ctx = self._ctx_ids.get(operation_context)
+            if ctx is None:
+                ctx = self._ctx_ids[operation_context] = len(self._attempts)
+                self._attempts.append(0)
+                self._successes.append(0)
+                self._failures.append(0)
+            self._attempts[ctx] += 1
+
+        # The logger formats the error lazily, only when INFO is enabled
         log.info(
             "🔄 Attempting recovery from %s in %s: %s",
             error_type,
             operation_context,
-            str(error)
+            error
         )
 
-        # Try specific strategies first
-        strategies_to_try = []
-
-        # Add error-specific strategies
-        if error_type in self.recovery_strategies:
-            strategies_to_try.extend(self.recovery_strategies[error_type])
-
-        # Add global strategies
-        strategies_to_try.extend(self.global_strategies)
-
-        # Sort by priority
-        strategies_to_try.sort(key=lambda x: x.priority, reverse=True)
+        # Specific and global strategies in priority order, specific first
+        # on ties
+        strategies_to_try = self._merged_cache.get(error_type)
+        if strategies_to_try is None:
+            if error_type in self.recovery_strategies or self.global_strategies:
+                strategies_to_try = self._merge_strategies(error_type)
+            else:
+                # Nothing applies: go straight to the failure result without
+                # building or caching an empty merge
+                strategies_to_try = ()
 
         # Try each strategy
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
         for strategy in strategies_to_try:
             try:
-                log.debug(
-                    "🔄 Trying recovery strategy: %s",
-                    strategy.strategy.value)
-
-                if strategy.strategy == RecoveryStrategy.SKIP:
-                    result = self._handle_skip_strategy(
-                        error, operation_context, strategy)
-                elif strategy.strategy == RecoveryStrategy.FALLBACK:
-                    result = self._handle_fallback_strategy(
-                        error, operation_context, strategy, fallback_data)
-                elif strategy.strategy == RecoveryStrategy.PARTIAL:
-                    result = self._handle_partial_strategy(
-                        error, operation_context, strategy)
-                elif strategy.strategy == RecoveryStrategy.DEGRADE:
-                    result = self._handle_degrade_strategy(
-                        error, operation_context, strategy)
-                elif strategy.strategy == RecoveryStrategy.MANUAL:
-                    result = self._handle_manual_strategy(
-                        error, operation_context, strategy)
-                elif strategy.strategy == RecoveryStrategy.ABORT:
-                    result = self._handle_abort_strategy(
-                        error, operation_context, strategy)
-                else:
-                    # Custom strategy with action function
-                    recovered_data = strategy.execute()
-                    result = RecoveryResult(
-                        success=True,
-                        strategy_used=strategy.strategy,
-                        recovered_data=recovered_data,
-                        message=f"Custom recovery strategy succeeded: {strategy.description}")
+                if debug_enabled:
+                    log.debug(
+                        "🔄 Trying recovery strategy: %s",
+                        strategy.strategy.value)
+
+                handler = self._HANDLERS.get(
+                    strategy.strategy, RecoveryManager._handle_custom_strategy)
+                result = handler(
+                    self, error, operation_context, strategy, fallback_data)
 
                 if result.success:
-                    self.recovery_stats[operation_context]["successes"] += 1
+                    with self._stats_lock:
+                        self._successes[ctx] += 1
                     log.info(
                         "✅ Recovery successful using %s strategy",
                         strategy.strategy.value)
@@ -225,7 +278,8 @@ class RecoveryManager:
                 continue
 
         # All strategies failed
-        self.recovery_stats[operation_context]["failures"] += 1
+        with self._stats_lock:
+            self._failures[ctx] += 1
         log.error("❌ All recovery strategies failed for %s", operation_context)
 
         return RecoveryResult(
@@ -235,11 +289,21 @@ class RecoveryManager:
             message=f"No recovery strategy succeeded for {error_type}"
         )
 
+    def _merge_strategies(self, error_type: str) -> Tuple[RecoveryAction, ...]:
+        """Merge the pre-sorted specific and global strategies and cache them."""
+        merged = tuple(heapq.merge(
+            self.recovery_strategies.get(error_type, ()),
+            self.global_strategies,
+            key=_descending_priority))
+        self._merged_cache[error_type] = merged
+        return merged
+
     def _handle_skip_strategy(
         self,
         error: Exception,
         operation_context: str,
-        strategy: RecoveryAction
+        strategy: RecoveryAction,
+        fallback_data: Optional[Any] = None
     ) -> RecoveryResult:
         """Handle skip recovery strategy."""
         log.warning("⏭️ Skipping failed operation: %s", operation_context)
@@ -284,7 +348,8 @@ class RecoveryManager:
         self,
         error: Exception,
         operation_context: str,
-        strategy: RecoveryAction
+        strategy: RecoveryAction,
+        fallback_data: Optional[Any] = None
     ) -> RecoveryResult:
         """Handle partial recovery strategy."""
         log.info(
@@ -304,7 +369,8 @@ class RecoveryManager:
         self,
         error: Exception,
         operation_context: str,
-        strategy: RecoveryAction
+        strategy: RecoveryAction,
+        fallback_data: Optional[Any] = None
     ) -> RecoveryResult:
         """Handle degradation recovery strategy."""
         if self.degradation_level >= self.max_degradation_level:
@@ -335,7 +401,8 @@ class RecoveryManager:
         self,
         error: Exception,
         operation_context: str,
-        strategy: RecoveryAction
+        strategy: RecoveryAction,
+        fallback_data: Optional[Any] = None
     ) -> RecoveryResult:
         """Handle manual intervention recovery strategy."""
         log.error("🔧 Manual intervention required for: %s", operation_context)
@@ -355,7 +422,8 @@ class RecoveryManager:
         self,
         error: Exception,
         operation_context: str,
-        strategy: RecoveryAction
+        strategy: RecoveryAction,
+        fallback_data: Optional[Any] = None
     ) -> RecoveryResult:
         """Handle abort recovery strategy."""
         log.error("🛑 Aborting operation: %s", operation_context)
@@ -367,6 +435,44 @@ class RecoveryManager:
             message=f"Operation aborted: {strategy.description}"
         )
 
+    def _handle_custom_strategy(
+        self,
+        error: Exception,
+        operation_context: str,
+        strategy: RecoveryAction,
+        fallback_data: Optional[Any] = None
+    ) -> RecoveryResult:
+        """Handle strategies without a dedicated handler via their action."""
+        recovered_data = strategy.execute()
+        return RecoveryResult(
+            success=True,
+            strategy_used=strategy.strategy,
+            recovered_data=recovered_data,
+            message=f"Custom recovery strategy succeeded: {strategy.description}")
+
+    # Strategy -> handler; anything else runs as a custom strategy
+    _HANDLERS: Dict[RecoveryStrategy, Callable[..., RecoveryResult]] = {
+        RecoveryStrategy.SKIP: _handle_skip_strategy,
+        RecoveryStrategy.FALLBACK: _handle_fallback_strategy,
+        RecoveryStrategy.PARTIAL: _handle_partial_strategy,
+        RecoveryStrategy.DEGRADE: _handle_degrade_strategy,
+        RecoveryStrategy.MANUAL: _handle_manual_strategy,
+        RecoveryStrategy.ABORT: _handle_abort_strategy,
+    }
+
+    @property
+    def recovery_stats(self) -> Dict[str, Dict[str, int]]:
+        """Attempt, success and failure counts per operation context."""
+        with self._stats_lock:
+            return {
+                context: {
+                    "attempts": self._attempts[ctx],
+                    "successes": self._successes[ctx],
+                    "failures": self._failures[ctx]
+                }
+                for context, ctx in self._ctx_ids.items()
+            }
+
     def get_recovery_stats(self) -> Dict[str, Dict[str, Union[int, float]]]:
         """Get recovery statistics."""
         stats = {}
@@ -465,115 +571,61 @@ def recoverable_operation(
     return decorator
 
 
-# Global recovery manager
-_global_recovery_manager = RecoveryManager()
+# Global recovery manager, created with the default strategies on first use
+_global_recovery_manager: Optional[RecoveryManager] = None
+_global_recovery_lock = threading.Lock()
 
 
 def get_global_recovery_manager() -> RecoveryManager:
     """Get the global recovery manager."""
+    global _global_recovery_manager
+    if _global_recovery_manager is None:
+        with _global_recovery_lock:
+            if _global_recovery_manager is None:
+                mgr = RecoveryManager()
+                setup_default_recovery_strategies(mgr)
+                _global_recovery_manager = mgr
     return _global_recovery_manager
 
 
-def setup_default_recovery_strategies():
-    """Setup default recovery strategies for common error types."""
-    mgr = _global_recovery_manager
-
+# Default (error type, strategy, description, priority) registrations
+_DEFAULT_STRATEGIES: Tuple[Tuple[Type[Exception], RecoveryStrategy, str, int], ...] = (
     # Network errors - retry with degradation
-    mgr.register_recovery_strategy(
-        NetworkError,
-        RecoveryStrategy.DEGRADE,
-        description="Reduce concurrent connections and retry",
-        priority=3
-    )
-
-    mgr.register_recovery_strategy(
-        NetworkError,
-        RecoveryStrategy.SKIP,
-        description="Skip failed network operation",
-        priority=1
-    )
-
+    (NetworkError, RecoveryStrategy.DEGRADE, "Reduce concurrent connections and retry", 3),
+    (NetworkError, RecoveryStrategy.SKIP, "Skip failed network operation", 1),
     # Source errors - fallback to cached data
-    mgr.register_recovery_strategy(
-        SourceError,
-        RecoveryStrategy.FALLBACK,
-        description="Use cached data if available",
-        priority=2
-    )
-
-    mgr.register_recovery_strategy(
-        SourceError,
-        RecoveryStrategy.SKIP,
-        description="Skip unavailable source",
-        priority=1
-    )
-
+    (SourceError, RecoveryStrategy.FALLBACK, "Use cached data if available", 2),
+    (SourceError, RecoveryStrategy.SKIP, "Skip unavailable source", 1),
     # Data errors - use partial data
-    mgr.register_recovery_strategy(
-        DataError,
-        RecoveryStrategy.PARTIAL,
-        description="Continue with valid data only",
-        priority=2
-    )
-
-    mgr.register_recovery_strategy(
-        DataError,
-        RecoveryStrategy.SKIP,
-        description="Skip invalid data",
-        priority=1
-    )
-
+    (DataError, RecoveryStrategy.PARTIAL, "Continue with valid data only", 2),
+    (DataError, RecoveryStrategy.SKIP, "Skip invalid data", 1),
     # System errors - manual intervention
-    mgr.register_recovery_strategy(
-        SystemError,
-        RecoveryStrategy.MANUAL,
-        description="Check system resources and permissions",
-        priority=3
-    )
-
-    mgr.register_recovery_strategy(
-        SystemError,
-        RecoveryStrategy.SKIP,
-        description="Skip system-dependent operation",
-        priority=1
-    )
-
+    (SystemError, RecoveryStrategy.MANUAL, "Check system resources and permissions", 3),
+    (SystemError, RecoveryStrategy.SKIP, "Skip system-dependent operation", 1),
     # Processing errors - degrade quality
-    mgr.register_recovery_strategy(
-        ProcessingError,
-        RecoveryStrategy.DEGRADE,
-        description="Reduce processing quality/complexity",
-        priority=2
-    )
+    (ProcessingError, RecoveryStrategy.DEGRADE, "Reduce processing quality/complexity", 2),
+    (ProcessingError, RecoveryStrategy.SKIP, "Skip complex processing", 1),
+    # Pipeline errors - abort
+    (PipelineError, RecoveryStrategy.ABORT, "Critical pipeline failure", 1),
+    # Concurrent errors - retry with reduced concurrency
+    (ConcurrentError, RecoveryStrategy.DEGRADE, "Reduce concurrent workers", 2),
+    (ConcurrentError, RecoveryStrategy.SKIP, "Skip concurrent operation", 1),
+)
 
-    mgr.register_recovery_strategy(
-        ProcessingError,
-        RecoveryStrategy.SKIP,
-        description="Skip complex processing",
-        priority=1
-    )
 
-    # Pipeline errors - abort
-    mgr.register_recovery_strategy(
-        PipelineError,
-        RecoveryStrategy.ABORT,
-        description="Critical pipeline failure",
-        priority=1
-    )
+def setup_default_recovery_strategies(
+        mgr: Optional[RecoveryManager] = None) -> None:
+    """Setup default recovery strategies for common error types.
 
-    # Concurrent errors - retry with reduced concurrency
-    mgr.register_recovery_strategy(
-        ConcurrentError,
-        RecoveryStrategy.DEGRADE,
-        description="Reduce concurrent workers",
-        priority=2
-    )
+    Registers into ``mgr``, or the global recovery manager when omitted.
+    """
+    if mgr is None:
+        mgr = get_global_recovery_manager()
 
-    mgr.register_recovery_strategy(
-        ConcurrentError,
-        RecoveryStrategy.SKIP,
-        description="Skip concurrent operation",
-        priority=1
+    mgr.register_bulk(
+        (error_type, RecoveryAction(
+            strategy, description=description, priority=priority))
+        for error_type, strategy, description, priority in _DEFAULT_STRATEGIES
     )
 
     # Global fallback - skip operation
@@ -610,7 +662,3 @@ class GracefulDegradationConfig:
 
         return self.degradation_thresholds.get(
             level, self.degradation_thresholds[3])
-
-
-# Initialize default strategies
-setup_default_recovery_strategies()
@@ -0,0 +1,123 @@
+"""Unit tests for etl.utils.performance_monitor.MetricsRing."""
+import pytest
+
+from etl.utils.performance_monitor import _HIST_MAXLEN, MetricsRing, _make_hist
+from etl.utils.performance_optimizer import PerformanceMetrics
+
+
+def _metrics(i):
+    """Build a sample whose fields are derived from ``i``."""
+    return PerformanceMetrics(
+        operation_name="op",
+        start_time=1000.0 + i,
+        end_time=1001.0 + i,
+        duration=1.0,
+        memory_before=100.0,
+        memory_after=100.0 + i % 7,
+        memory_peak=120.0 + i % 5,
+        cpu_percent=50.0,
+        worker_count=1,
+        items_processed=i,
+        bytes_processed=2 * i,
+    )
+
+
+def _expected_totals(samples):
+    return (
+        sum(m.items_processed for m in samples),
+        sum(m.bytes_processed for m in samples),
+        sum(m.memory_efficiency for m in samples),
+    )
+
+
+def _assert_totals(ring, samples):
+    items, bytes_, efficiency = ring.totals()
+    exp_items, exp_bytes, exp_efficiency = _expected_totals(samples)
+    assert items == exp_items
+    assert bytes_ == exp_bytes
+    assert efficiency == pytest.approx(exp_efficiency)
+
+
+class TestMetricsRingWrap:
+    """Test behaviour once the ring wraps past its capacity."""
+
+    @pytest.mark.unit
+    def test_history_wraps_past_maxlen(self):
+        ring = _make_hist()
+        assert ring.capacity == _HIST_MAXLEN
+
+        samples = [_metrics(i) for i in range(_HIST_MAXLEN + 250)]
+        for m in samples:
+            ring.append(m)
+
+        retained = samples[-_HIST_MAXLEN:]
+        assert len(ring) == _HIST_MAXLEN
+        assert ring.oldest_start_time() == retained[0].start_time
+        assert list(ring.snapshot()["start_time"]) == [m.start_time for m in retained]
+        _assert_totals(ring, retained)
+
+    @pytest.mark.unit
+    def test_snapshot_order_across_wrap(self):
+        ring = MetricsRing(4)
+        samples = [_metrics(i) for i in range(6)]
+        for m in samples:
+            ring.append(m)
+
+        snapshot = ring.snapshot()
+        assert list(snapshot["start_time"]) == [m.start_time for m in samples[2:]]
+        assert list(snapshot["items_processed"]) == [2, 3, 4, 5]
+
+    @pytest.mark.unit
+    def test_snapshot_is_a_copy(self):
+        ring = MetricsRing(3)
+        for i in range(5):
+            ring.append(_metrics(i))
+
+        snapshot = ring.snapshot()
+        ring.append(_metrics(5))
+        assert list(snapshot["items_processed"]) == [2, 3, 4]
+
+
+class TestMetricsRingPopleft:
+    """Test totals and ordering after popleft."""
+
+    @pytest.mark.unit
+    def test_totals_after_popleft_on_wrapped_ring(self):
+        ring = MetricsRing(5)
+        samples = [_metrics(i) for i in range(8)]
+        for m in samples:
+            ring.append(m)
+
+        ring.popleft()
+        ring.popleft()
+
+        retained = samples[5:]
+        assert len(ring) == 3
+        assert ring.oldest_start_time() == retained[0].start_time
+        assert list(ring.snapshot()["items_processed"]) == [5, 6, 7]
+        _assert_totals(ring, retained)
+
+    @pytest.mark.unit
+    def test_append_after_popleft_keeps_order(self):
+        ring = MetricsRing(3)
+        samples = [_metrics(i) for i in range(4)]
+        for m in samples:
+            ring.append(m)
+        ring.popleft()
+        ring.append(_metrics(4))
+        ring.append(_metrics(5))
+
+        assert list(ring.snapshot()["items_processed"]) == [3, 4, 5]
+        _assert_totals(ring, [_metrics(i) for i in (3, 4, 5)])
+
+    @pytest.mark.unit
+    def test_popleft_until_empty(self):
+        ring = MetricsRing(3)
+        for i in range(5):
+            ring.append(_metrics(i))
+        for _ in range(4):
+            ring.popleft()
+
+        assert len(ring) == 0
+        assert ring.totals() == (0, 0, pytest.approx(0.0))
+        assert len(ring.snapshot()) == 0
@@ -0,0 +1,182 @@
+"""Unit tests for etl.utils.performance.ResponseCache."""
+import pytest
+
+from etl.utils import performance
+from etl.utils.performance import ResponseCache
+
+
+def _urls_in_shard(cache, shard, count):
+    """Return ``count`` URLs whose cache keys land in ``shard``."""
+    urls = []
+    i = 0
+    while len(urls) < count:
+        url = f"https://example.com/item/{i}"
+        if cache._shard(cache._generate_key(url)) is shard:
+            urls.append(url)
+        i += 1
+    return urls
+
+
+class TestResponseCacheEviction:
+    """Test per-shard LRU eviction."""
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used_in_shard(self):
+        cache = ResponseCache(max_size=32)
+        assert len(cache._shards) == 16
+        assert cache._shard_max_size == 2
+
+        shard = cache._shards[0]
+        first, second, third = _urls_in_shard(cache, shard, 3)
+
+        cache.set(first, "a")
+        cache.set(second, "b")
+        # Touch the first entry so the second becomes least recently used
+        assert cache.get(first) == "a"
+        cache.set(third, "c")
+
+        assert cache.get(second) is None
+        assert cache.get(first) == "a"
+        assert cache.get(third) == "c"
+
+    @pytest.mark.unit
+    def test_eviction_leaves_other_shards_alone(self):
+        cache = ResponseCache(max_size=32)
+        other = _urls_in_shard(cache, cache._shards[1], 1)[0]
+        cache.set(other, "other")
+
+        for url in _urls_in_shard(cache, cache._shards[0], 5):
+            cache.set(url, "x")
+
+        assert cache.get(other) == "other"
+        assert len(cache._shards[0][0]) == 2
+
+    @pytest.mark.unit
+    def test_reset_moves_entry_to_most_recent(self):
+        cache = ResponseCache(max_size=32)
+        first, second, third = _urls_in_shard(cache, cache._shards[0], 3)
+
+        cache.set(first, "a")
+        cache.set(second, "b")
+        cache.set(first, "a2")
+        cache.set(third, "c")
+
+        assert cache.get(second) is None
+        assert cache.get(first) == "a2"
+
+
+class TestResponseCacheTTL:
+    """Test TTL expiry."""
+
+    @pytest.mark.unit
+    def test_entry_expires_after_ttl(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(performance.time, "time", lambda: now[0])
+        cache = ResponseCache(default_ttl=60)
+
+        cache.set("https://example.com/a", "short", ttl=10)
+        cache.set("https://example.com/b", "default")
+
+        now[0] += 10
+        assert cache.get("https://example.com/a") == "short"
+
+        now[0] += 1
+        assert cache.get("https://example.com/a") is None
+        assert cache.get("https://example.com/b") == "default"
+
+        now[0] += 50
+        assert cache.get("https://example.com/b") is None
+
+    @pytest.mark.unit
+    def test_expired_entry_is_removed(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(performance.time, "time", lambda: now[0])
+        cache = ResponseCache()
+
+        cache.set("https://example.com/a", "data", ttl=5)
+        now[0] += 6
+        assert cache.get("https://example.com/a") is None
+        assert cache.stats()["size"] == 0
+
+
+class TestResponseCacheSizing:
+    """Test shard sizing when max_size is not a multiple of the shard count."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("max_size", [1, 3, 10, 17, 1000])
+    def test_total_capacity_never_exceeds_max_size(self, max_size):
+        cache = ResponseCache(max_size=max_size)
+        num_shards = len(cache._shards)
+
+        assert num_shards & (num_shards - 1) == 0
+        assert num_shards <= max_size
+        assert cache._shard_max_size * num_shards <= max_size
+
+        for i in range(max_size * 4):
+            cache.set(f"https://example.com/{i}", i)
+
+        assert cache.stats()["size"] <= max_size
+        for entries, _ in cache._shards:
+            assert len(entries) <= cache._shard_max_size
+
+    @pytest.mark.unit
+    def test_single_entry_cache(self):
+        cache = ResponseCache(max_size=1)
+        assert len(cache._shards) == 1
+
+        cache.set("https://example.com/a", "a")
+        cache.set("https://example.com/b", "b")
+
+        assert cache.get("https://example.com/a") is None
+        assert cache.get("https://example.com/b") == "b"
+
+
+class TestResponseCacheStats:
+    """Test stats() totals across shards."""
+
+    @pytest.mark.unit
+    def test_stats_sum_over_shards(self):
+        cache = ResponseCache(max_size=1000)
+        payloads = {f"https://example.com/{i}": b"x" * (i + 1) for i in range(50)}
+        for url, data in payloads.items():
+            cache.set(url, data)
+
+        stats = cache.stats()
+        assert stats["size"] == len(payloads)
+        assert stats["max_size"] == 1000
+        assert stats["memory_usage_estimate"] == sum(len(d) for d in payloads.values())
+        assert sum(1 for entries, _ in cache._shards if entries) > 1
+
+    @pytest.mark.unit
+    def test_stats_after_clear(self):
+        cache = ResponseCache()
+        cache.set("https://example.com/a", "abc")
+        cache.clear()
+
+        stats = cache.stats()
+        assert stats["size"] == 0
+        assert stats["memory_usage_estimate"] == 0
+
+    @pytest.mark.unit
+    def test_oversized_response_not_cached(self):
+        cache = ResponseCache(max_response_size=4)
+        cache.set("https://example.com/a", "too long")
+
+        assert cache.get("https://example.com/a") is None
+        assert cache.stats()["size"] == 0
+
+    @pytest.mark.unit
+    def test_large_parsed_json_not_cached(self):
+        cache = ResponseCache(max_response_size=1024)
+        payload = {"features": [{"name": "x" * 100, "id": i} for i in range(50)]}
+        cache.set("https://example.com/a", payload)
+
+        assert cache.get("https://example.com/a") is None
+
+    @pytest.mark.unit
+    def test_stats_count_nested_content(self):
+        cache = ResponseCache()
+        payload = {"features": ["x" * 500, "y" * 500]}
+        cache.set("https://example.com/a", payload)
+
+        assert cache.stats()["memory_usage_estimate"] >= 1000
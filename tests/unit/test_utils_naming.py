@@ -4,7 +4,8 @@ import pytest
 from etl.utils.naming import (
     sanitize_for_filename,
     sanitize_for_arcgis_name,
-    generate_fc_name
+    generate_fc_name,
+    sanitize_sde_name
 )
 
 
@@ -128,3 +129,25 @@ class TestGenerateFcName:
     def test_fc_name_authority_with_numbers(self):
         result = generate_fc_name("AUTH123", "Test Data")
         assert result == "AUTH123_test_data"
+
+
+class TestSanitizeSdeName:
+    """Test sanitize_sde_name function."""
+
+    @pytest.mark.unit
+    def test_sde_separators_collapse_to_single_underscore(self):
+        assert sanitize_sde_name(
+            "Hello-World.v2 test") == "Hello_World_v2_test"
+        assert sanitize_sde_name("a__b  c") == "a_b_c"
+
+    @pytest.mark.unit
+    def test_sde_lowercase_swedish_chars(self):
+        assert sanitize_sde_name("åäö_data") == "aao_data"
+
+    @pytest.mark.unit
+    def test_sde_starts_with_digit(self):
+        assert sanitize_sde_name("123 data") == "fc_123_data"
+
+    @pytest.mark.unit
+    def test_sde_only_separators(self):
+        assert sanitize_sde_name("---") == "unnamed_fc"